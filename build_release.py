@@ -8,14 +8,50 @@ This script creates platform-specific executables using PyInstaller
 import os
 import sys
 import platform
-import subprocess
-import shutil
+import functools
+import importlib.util
+import argparse
+import string
+from collections import deque
 from pathlib import Path
 
+# Bytecode optimization level for the frozen app (2 = python -OO: no asserts, no docstrings)
+OPTIMIZE_LEVEL = 2
+
+# UPX shrinks the bundle on disk but lengthens the build and makes every launch decompress the
+# libraries again; set USE_UPX=1 to turn it on
+USE_UPX = os.environ.get("USE_UPX", "").lower() in ("1", "true", "yes")
+
+# Libraries UPX is known to break or slow down, never compressed even with USE_UPX
+UPX_EXCLUDE = [
+    'vcruntime140.dll',
+    'python*.dll',
+    'tcl86t.dll',
+    'tk86t.dll',
+    'libcrypto-*.dll',
+    'libssl-*.dll',
+    '_tkinter*.pyd',
+    'Qt*.dll',
+]
+
+# Optional dependencies of pandas and friends that the app never uses; keeping them out of the
+# module graph shortens Analysis and shrinks the bundle. matplotlib and PIL stay in for the
+# charts, and numba stays in (when installed) so the frozen app keeps the compiled cash sweep.
+EXCLUDED_MODULES = [
+    'scipy',
+    'IPython',
+    'jupyter',
+    'notebook',
+    'jinja2',
+    'pytest',
+    'sphinx',
+    'tornado',
+]
+
+@functools.lru_cache(maxsize=1)
 def get_platform_info():
-    """Get platform-specific information"""
+    """Get platform-specific information (detected once per build)"""
     system = platform.system()
-    machine = platform.machine()
     
     if system == "Darwin":
         return "macOS", "app"
@@ -24,28 +60,102 @@ def get_platform_info():
     else:
         return "Linux", "bin"
 
-def install_pyinstaller():
-    """Install PyInstaller if not available"""
-    try:
-        import PyInstaller
-        print("✅ PyInstaller is already installed")
-        return True
-    except ImportError:
-        print("📦 Installing PyInstaller...")
+def pip_install(*requirements):
+    """
+    Install packages with pip inside this process, or in a pip subprocess when pip
+    cannot be imported here
+    
+    A failure during an in-process install is reported as is; it is not retried in a
+    subprocess on top of a half-finished install.
+    
+    Returns:
+    bool: True if pip succeeded
+    """
+    import runpy
+    import subprocess
+    
+    if importlib.util.find_spec("pip") is not None:
+        old_argv = sys.argv
+        sys.argv = ["pip", "install", *requirements]
         try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
-            print("✅ PyInstaller installed successfully")
+            runpy.run_module("pip", run_name="__main__", alter_sys=True)
             return True
-        except subprocess.CalledProcessError:
-            print("❌ Failed to install PyInstaller")
+        except SystemExit as exit_request:
+            return not exit_request.code
+        except ImportError:
+            # pip's modules do not load in this interpreter: use a separate one below
+            pass
+        except Exception as e:
+            print(f"❌ pip failed: {e}")
             return False
+        finally:
+            sys.argv = old_argv
+            importlib.invalidate_caches()
+    
+    try:
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *requirements])
+        return True
+    except subprocess.CalledProcessError:
+        return False
 
-def create_spec_file():
-    """Create PyInstaller spec file for the application"""
+def install_pyinstaller():
+    """Install PyInstaller if not available"""
+    # Only locate the package; importing it would run PyInstaller's own start-up code
+    if importlib.util.find_spec("PyInstaller") is not None:
+        print("✅ PyInstaller is already installed")
+        pin_fast_pefile()
+        return True
     
-    platform_name, _ = get_platform_info()
+    print("📦 Installing PyInstaller...")
+    if not pip_install("pyinstaller"):
+        print("❌ Failed to install PyInstaller")
+        return False
+    print("✅ PyInstaller installed successfully")
+    pin_fast_pefile()
+    return True
+
+# pefile 2024.8.26 made PyInstaller's binary dependency scan on Windows many times slower
+# (PyInstaller issues #8762 and #8832); the previous release keeps builds on the fast path
+FAST_PEFILE_VERSION = "2023.2.7"
+SLOW_PEFILE_VERSION = (2024, 8, 26)
+
+def pin_fast_pefile():
+    """On Windows, install the pefile release that keeps PyInstaller's binary scan fast"""
+    if get_platform_info()[0] != "Windows":
+        return
     
-    spec_content = f'''# -*- mode: python ; coding: utf-8 -*-
+    pefile_version = get_package_version("pefile")
+    if pefile_version is not None and pefile_version < SLOW_PEFILE_VERSION:
+        return
+    
+    print(f"📦 Installing pefile {FAST_PEFILE_VERSION} for faster Windows builds...")
+    if not pip_install(f"pefile=={FAST_PEFILE_VERSION}"):
+        print("⚠️  Could not install pefile - the build will work, but binary analysis may be slow")
+
+def get_package_version(package):
+    """Get an installed package's version as a tuple of ints, or None if not installed"""
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+        try:
+            return tuple(int(part) for part in version(package).split(".")[:3])
+        except PackageNotFoundError:
+            return None
+    except (ImportError, ValueError):
+        return None
+
+def get_pyinstaller_version():
+    """Get the installed PyInstaller version as a tuple of ints, or None if not installed"""
+    return get_package_version("pyinstaller")
+
+def supports_spec_optimize():
+    """Check whether PyInstaller accepts the optimize setting in the spec file (6.6+)"""
+    pyinstaller_version = get_pyinstaller_version()
+    return pyinstaller_version is not None and pyinstaller_version >= (6, 6)
+
+# PyInstaller spec, parsed once; create_spec_file() fills in the build settings. Keep lists
+# sorted and the output free of timestamps/temp paths: the same inputs must give the same spec
+# so PyInstaller's analysis cache stays valid between builds.
+_SPEC_TEMPLATE = string.Template('''# -*- mode: python ; coding: utf-8 -*-
 
 block_cipher = None
 
@@ -54,28 +164,28 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[
+        ('GUI_README.md', '.'),
         ('cash_balance_tracker.py', '.'),
         ('requirements.txt', '.'),
-        ('GUI_README.md', '.'),
     ],
     hiddenimports=[
-        'pandas',
         'numpy',
         'openpyxl',
+        'pandas',
         'tkinter',
-        'tkinter.ttk',
         'tkinter.filedialog',
         'tkinter.messagebox',
         'tkinter.scrolledtext',
+        'tkinter.ttk',
     ],
     hookspath=[],
-    hooksconfig={{}},
+    hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=${excludes},
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
-    noarchive=False,
+    noarchive=False,${analysis_optimize}
 )
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
@@ -86,13 +196,13 @@ exe = EXE(
     a.binaries,
     a.zipfiles,
     a.datas,
-    [],
+    ${exe_options},
     name='CashBalanceTracker',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
-    upx_exclude=[],
+    upx=${upx},
+    upx_exclude=${upx_exclude},
     runtime_tmpdir=None,
     console=False,
     disable_windowed_traceback=False,
@@ -100,17 +210,63 @@ exe = EXE(
     target_arch=None,
     codesign_identity=None,
     entitlements_file=None,
-    icon='app_icon.ico' if platform.system() == 'Windows' else 'app_icon.icns',
+    icon=${icon},
 )
 
 # macOS App Bundle
-{"app = BUNDLE(exe, name='CashBalanceTracker.app', icon='app_icon.icns', bundle_identifier='com.cashbalancetracker.app')" if platform_name == "macOS" else ""}
-'''
+${bundle_line}
+''')
+
+def create_spec_file():
+    """
+    Create PyInstaller spec file for the application
+    
+    Returns:
+    bool: True if the spec file was written, False if it was already up to date
+    """
     
-    with open('CashBalanceTracker.spec', 'w') as f:
-        f.write(spec_content)
+    platform_name, _ = get_platform_info()
+    
+    # Compile collected modules at OPTIMIZE_LEVEL and run the app with matching sys.flags.optimize.
+    # Older PyInstaller versions get PYTHONOPTIMIZE from build_executable() instead.
+    if supports_spec_optimize():
+        analysis_optimize = f"\n    optimize={OPTIMIZE_LEVEL},"
+        exe_options = "[" + ", ".join(["('O', None, 'OPTION')"] * OPTIMIZE_LEVEL) + "]"
+    else:
+        analysis_optimize = ""
+        exe_options = "[]"
+    
+    # Resolve the icon now so the spec holds a literal; no icon when the file does not exist
+    icon_path = {'Windows': 'app_icon.ico', 'macOS': 'app_icon.icns'}.get(platform_name)
+    if icon_path is not None and not os.path.exists(icon_path):
+        icon_path = None
+    
+    bundle_line = (f"app = BUNDLE(exe, name='CashBalanceTracker.app', icon={icon_path!r}, "
+                   "bundle_identifier='com.cashbalancetracker.app')" if platform_name == "macOS" else "")
+    
+    spec_content = _SPEC_TEMPLATE.substitute(
+        analysis_optimize=analysis_optimize,
+        exe_options=exe_options,
+        upx=repr(USE_UPX),
+        upx_exclude=repr(UPX_EXCLUDE),
+        excludes=repr(EXCLUDED_MODULES),
+        icon=repr(icon_path),
+        bundle_line=bundle_line,
+    )
+    
+    # Leave an unchanged spec alone so PyInstaller can reuse its build cache
+    spec_path = Path('CashBalanceTracker.spec')
+    if spec_path.exists() and spec_path.read_text() == spec_content:
+        print("✅ PyInstaller spec file is up to date")
+        return False
+    
+    # Write atomically so an interrupted run never leaves a half-written spec behind
+    tmp_path = spec_path.with_suffix('.spec.tmp')
+    tmp_path.write_text(spec_content)
+    tmp_path.replace(spec_path)
     
     print("✅ Created PyInstaller spec file")
+    return True
 
 def create_icons():
     """Create application icons (placeholder text files for now)"""
@@ -131,55 +287,187 @@ You can create these from a source image using online converters or tools like:
 - Command line tools (iconutil on macOS)
 
 For now, the app will use default system icons.
+
+# UPX Compression
+
+UPX is off by default: it makes the executable smaller on disk, but the build takes
+longer and the app starts slower because the libraries are decompressed on every launch.
+Set USE_UPX=1 before running build_release.py to enable it.
 """
     
     with open('ICON_README.txt', 'w') as f:
         f.write(icon_info)
 
-def build_executable():
-    """Build the standalone executable"""
+def _dir_entries(path):
+    """Read a directory once and return its entries by name (empty if it does not exist)"""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry for entry in entries}
+    except OSError:
+        return {}
+
+def build_executable(force=False):
+    """
+    Build the standalone executable
+    
+    Parameters:
+    force: Discard PyInstaller's build cache even if the spec file has not changed
+    """
+    import subprocess
     
     platform_name, extension = get_platform_info()
     
     print(f"🔨 Building for {platform_name}...")
     
     # Create the spec file
-    create_spec_file()
+    spec_changed = create_spec_file()
     create_icons()
     
-    # Build with PyInstaller
+    # Build with PyInstaller, reusing its cache unless the spec changed or a clean build is forced
     try:
-        cmd = [sys.executable, "-m", "PyInstaller", "CashBalanceTracker.spec", "--clean"]
+        cmd = [sys.executable, "-m", "PyInstaller", "CashBalanceTracker.spec"]
+        if spec_changed or force:
+            cmd.append("--clean")
+        
+        # Fixed hash seed so PyInstaller's module graph is walked in the same order every build;
+        # PyInstaller before 6.6 compiles bytecode at the optimization level it runs with
+        env = os.environ.copy()
+        env["PYTHONHASHSEED"] = "0"
+        if not supports_spec_optimize():
+            env["PYTHONOPTIMIZE"] = str(OPTIMIZE_LEVEL)
         
         print(f"Running: {' '.join(cmd)}")
-        result = subprocess.run(cmd, capture_output=True, text=True)
         
-        if result.returncode == 0:
+        # Stream PyInstaller's log as it runs, keeping only the tail for the failure report
+        recent_output = deque(maxlen=200)
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              text=True, bufsize=1, env=env) as proc:
+            for line in proc.stdout:
+                sys.stdout.write(line)
+                recent_output.append(line)
+            returncode = proc.wait()
+        
+        if returncode == 0:
             print("✅ Build completed successfully!")
             
             # Show output location
+            dist_entries = _dir_entries("dist")
             if platform_name == "macOS":
                 app_path = "dist/CashBalanceTracker.app"
-                if os.path.exists(app_path):
+                if "CashBalanceTracker.app" in dist_entries:
                     print(f"📱 macOS App Bundle created: {app_path}")
                     print("   You can drag this to Applications folder")
             else:
-                exe_path = f"dist/CashBalanceTracker{'.exe' if platform_name == 'Windows' else ''}"
-                if os.path.exists(exe_path):
-                    print(f"💻 Executable created: {exe_path}")
+                exe_name = f"CashBalanceTracker{'.exe' if platform_name == 'Windows' else ''}"
+                if exe_name in dist_entries:
+                    print(f"💻 Executable created: dist/{exe_name}")
             
             return True
         else:
             print("❌ Build failed:")
-            print(result.stderr)
+            print("".join(recent_output))
             return False
             
     except Exception as e:
         print(f"❌ Build error: {e}")
         return False
 
-def create_release_package():
-    """Create a complete release package"""
+# Linux ioctl that makes dst share src's data blocks (btrfs, XFS and other reflink filesystems)
+FICLONE = 0x40049409
+
+def _clone_file(src, dst, hardlink=False):
+    """
+    Copy src to dst, sharing data blocks through a reflink clone where the filesystem allows it.
+    
+    A clone is copy-on-write, so later changes to either file (a rebuild rewriting dist/,
+    stripping or signing the release copy) never show up in the other. Falls back to a
+    regular copy of data and permission bits.
+    
+    Parameters:
+    src, dst: Source and destination file paths
+    hardlink: Try a hardlink first; src and dst then stay the same file (opt-in via --hardlink)
+    
+    Returns:
+    str: dst
+    """
+    import shutil
+    import subprocess
+    
+    if hardlink:
+        try:
+            os.link(src, dst)
+            return dst
+        except OSError:
+            pass
+    
+    platform_name, _ = get_platform_info()
+    if platform_name == "Linux":
+        try:
+            import fcntl
+            with open(src, 'rb') as src_file, open(dst, 'wb') as dst_file:
+                fcntl.ioctl(dst_file.fileno(), FICLONE, src_file.fileno())
+            shutil.copymode(src, dst)
+            return dst
+        except OSError:
+            pass
+    elif platform_name == "macOS":
+        # APFS clonefile via cp -c
+        try:
+            subprocess.check_call(['cp', '-c', src, dst], stderr=subprocess.DEVNULL)
+            return dst
+        except (OSError, subprocess.CalledProcessError):
+            pass
+    
+    return shutil.copy(src, dst)
+
+def _clone_tree(src, dst, hardlink=False):
+    """Copy a directory tree without duplicating file data where the filesystem allows it"""
+    import shutil
+    import subprocess
+    
+    platform_name, _ = get_platform_info()
+    if platform_name == "macOS" and not hardlink:
+        # APFS clonefile via cp -c; plain copy on filesystems without clone support
+        try:
+            subprocess.check_call(['cp', '-Rc', src, dst])
+            return
+        except (OSError, subprocess.CalledProcessError):
+            shutil.rmtree(dst, ignore_errors=True)
+        shutil.copytree(src, dst, symlinks=True, copy_function=shutil.copy)
+    elif platform_name == "Linux" or hardlink:
+        shutil.copytree(src, dst, symlinks=True,
+                        copy_function=functools.partial(_clone_file, hardlink=hardlink))
+    else:
+        # The release folder is disposable: copy data and permission bits, skip timestamps
+        shutil.copytree(src, dst, symlinks=True, copy_function=shutil.copy)
+
+# Documentation shipped next to the executable in every release
+RELEASE_DOCS = [
+    "GUI_README.md",
+    "CSV_Usage_Guide.md",
+    "FIXES_AND_USAGE_GUIDE.md",
+    "requirements.txt",
+    "ICON_README.txt"
+]
+
+@functools.lru_cache(maxsize=1)
+def _present_docs():
+    """
+    Names of the RELEASE_DOCS files present in the project root, read with one directory scan.
+    Cached for the rest of the run, so only call it once the build has generated its docs.
+    """
+    with os.scandir(".") as entries:
+        return frozenset(entry.name for entry in entries
+                         if entry.name in RELEASE_DOCS and entry.is_file())
+
+def create_release_package(hardlink=False):
+    """
+    Create a complete release package
+    
+    Parameters:
+    hardlink: Hardlink the built executable/app files instead of cloning or copying them
+    """
+    import shutil
     
     platform_name, _ = get_platform_info()
     
@@ -191,29 +479,22 @@ def create_release_package():
     
     print(f"📦 Creating release package in {release_dir}/")
     
-    # Copy documentation
-    docs_to_copy = [
-        "GUI_README.md",
-        "CSV_Usage_Guide.md", 
-        "FIXES_AND_USAGE_GUIDE.md",
-        "requirements.txt",
-        "ICON_README.txt"
-    ]
-    
-    for doc in docs_to_copy:
-        if os.path.exists(doc):
-            shutil.copy2(doc, release_dir)
+    # Copy documentation (one directory read each for the project root and dist/, then
+    # in-memory lookups)
+    for doc in [doc for doc in RELEASE_DOCS if doc in _present_docs()]:
+        shutil.copyfile(doc, os.path.join(release_dir, doc))
     
     # Copy the built executable/app
+    dist_entries = _dir_entries("dist")
     if platform_name == "macOS":
-        app_path = "dist/CashBalanceTracker.app"
-        if os.path.exists(app_path):
-            shutil.copytree(app_path, f"{release_dir}/CashBalanceTracker.app")
+        app_entry = dist_entries.get("CashBalanceTracker.app")
+        if app_entry is not None and app_entry.is_dir():
+            _clone_tree(app_entry.path, f"{release_dir}/CashBalanceTracker.app", hardlink=hardlink)
     else:
         exe_name = f"CashBalanceTracker{'.exe' if platform_name == 'Windows' else ''}"
-        exe_path = f"dist/{exe_name}"
-        if os.path.exists(exe_path):
-            shutil.copy2(exe_path, f"{release_dir}/{exe_name}")
+        exe_entry = dist_entries.get(exe_name)
+        if exe_entry is not None and exe_entry.is_file():
+            _clone_file(exe_entry.path, f"{release_dir}/{exe_name}", hardlink=hardlink)
     
     # Create installation instructions
     install_instructions = create_install_instructions(platform_name)
@@ -223,11 +504,79 @@ def create_release_package():
     print(f"✅ Release package created: {release_dir}/")
     return release_dir
 
-def create_install_instructions(platform_name):
-    """Create platform-specific installation instructions"""
+def _reproducible_tarinfo(tarinfo):
+    """Normalize archive metadata so the same inputs always produce the same archive"""
+    tarinfo.mtime = int(os.environ.get("SOURCE_DATE_EPOCH", 0))
+    tarinfo.uid = tarinfo.gid = 0
+    tarinfo.uname = tarinfo.gname = ""
+    return tarinfo
+
+def _add_release_files(tar, platform_name, root):
+    """Add the docs, the built executable/app and INSTALLATION.md to an open tar archive"""
+    import io
+    import tarfile
+    
+    for doc in [doc for doc in RELEASE_DOCS if doc in _present_docs()]:
+        tar.add(doc, arcname=f"{root}/{doc}", filter=_reproducible_tarinfo)
     
+    dist_entries = _dir_entries("dist")
     if platform_name == "macOS":
-        return """# Cash Balance Tracker - macOS Installation
+        app_entry = dist_entries.get("CashBalanceTracker.app")
+        if app_entry is not None and app_entry.is_dir():
+            tar.add(app_entry.path, arcname=f"{root}/CashBalanceTracker.app", filter=_reproducible_tarinfo)
+    else:
+        exe_name = f"CashBalanceTracker{'.exe' if platform_name == 'Windows' else ''}"
+        exe_entry = dist_entries.get(exe_name)
+        if exe_entry is not None and exe_entry.is_file():
+            tar.add(exe_entry.path, arcname=f"{root}/{exe_name}", filter=_reproducible_tarinfo)
+    
+    instructions = create_install_instructions(platform_name).encode("utf-8")
+    info = _reproducible_tarinfo(tarfile.TarInfo(f"{root}/INSTALLATION.md"))
+    info.size = len(instructions)
+    info.mode = 0o644
+    tar.addfile(info, io.BytesIO(instructions))
+
+def create_release_archive():
+    """
+    Create the release package directly as a .tar.gz, without copying into a release folder first
+    
+    Compression runs through pigz on all cores when it is installed, otherwise through gzip.
+    
+    Returns:
+    str: Path of the archive
+    """
+    import gzip
+    import shutil
+    import subprocess
+    import tarfile
+    
+    platform_name, _ = get_platform_info()
+    root = f"release_package_{platform_name.lower()}"
+    archive_path = f"{root}.tar.gz"
+    
+    print(f"📦 Creating release archive {archive_path}")
+    
+    pigz = shutil.which("pigz")
+    if pigz:
+        with open(archive_path, 'wb') as archive_file:
+            with subprocess.Popen([pigz, "-6", "-n"], stdin=subprocess.PIPE, stdout=archive_file) as proc:
+                with tarfile.open(fileobj=proc.stdin, mode='w|') as tar:
+                    _add_release_files(tar, platform_name, root)
+                proc.stdin.close()
+        if proc.returncode != 0:
+            raise RuntimeError(f"pigz failed with exit code {proc.returncode}")
+    else:
+        # Fixed gzip header time as well, so rebuilding unchanged inputs gives identical bytes
+        with gzip.GzipFile(archive_path, 'wb', compresslevel=6, mtime=0) as gz:
+            with tarfile.open(fileobj=gz, mode='w') as tar:
+                _add_release_files(tar, platform_name, root)
+    
+    print(f"✅ Release archive created: {archive_path}")
+    return archive_path
+
+# Platform-specific installation instructions, keyed by get_platform_info() platform name
+_INSTALL_INSTRUCTIONS = {
+    "macOS": """# Cash Balance Tracker - macOS Installation
 
 ## Installation Options
 
@@ -265,10 +614,9 @@ Install openpyxl: `pip3 install openpyxl`
 ## System Requirements
 - macOS 10.12 (Sierra) or later
 - 64-bit Intel or Apple Silicon Mac
-"""
+""",
 
-    elif platform_name == "Windows":
-        return """# Cash Balance Tracker - Windows Installation
+    "Windows": """# Cash Balance Tracker - Windows Installation
 
 ## Installation Options
 
@@ -305,10 +653,9 @@ The standalone version includes Excel support
 ## System Requirements
 - Windows 7 SP1 or later
 - 64-bit Windows recommended
-"""
+""",
 
-    else:  # Linux
-        return """# Cash Balance Tracker - Linux Installation
+    "Linux": """# Cash Balance Tracker - Linux Installation
 
 ## Installation Options
 
@@ -344,11 +691,30 @@ pip3 install pandas openpyxl
 - Linux with X11 (most desktop distributions)
 - Python 3.8 or later
 - tkinter support
-"""
+""",
+}
+
+def create_install_instructions(platform_name):
+    """Create platform-specific installation instructions"""
+    return _INSTALL_INSTRUCTIONS.get(platform_name, _INSTALL_INSTRUCTIONS["Linux"])
 
 def main():
     """Main build function"""
     
+    parser = argparse.ArgumentParser(description="Build a standalone Cash Balance Tracker release")
+    parser.add_argument("--force", action="store_true",
+                        help="discard PyInstaller's build cache and rebuild from scratch")
+    parser.add_argument("--archive", action="store_true",
+                        help="write the release package as a .tar.gz instead of a folder")
+    parser.add_argument("--hardlink", action="store_true",
+                        help="hardlink the built executable into the release folder instead of "
+                             "copying it (the release copy and dist/ then share one file)")
+    args = parser.parse_args()
+    if args.archive:
+        make_release = create_release_archive
+    else:
+        make_release = functools.partial(create_release_package, hardlink=args.hardlink)
+    
     print("🚀 Cash Balance Tracker - Release Builder")
     print("=" * 50)
     
@@ -358,17 +724,17 @@ def main():
     # Check if we can build standalone executables
     if not install_pyinstaller():
         print("⚠️  PyInstaller not available. Creating source release only.")
-        release_dir = create_release_package()
+        release_dir = make_release()
         print(f"✅ Source release package created: {release_dir}")
         return
     
     # Build executable
-    if build_executable():
+    if build_executable(force=args.force):
         # Create complete release package
-        release_dir = create_release_package()
+        release_dir = make_release()
         
         print("\n🎉 Release build completed successfully!")
-        print(f"📁 Release package: {release_dir}/")
+        print(f"📁 Release package: {release_dir}{'' if args.archive else '/'}")
         print(f"🔧 Platform: {platform_name}")
         
         if platform_name == "macOS":
@@ -379,7 +745,7 @@ def main():
             print("🐧 Linux binary ready for distribution")
             
         print("\n📋 Next steps:")
-        print(f"1. Test the application in {release_dir}/")
+        print(f"1. Test the application in {release_dir}{'' if args.archive else '/'}")
         print("2. Distribute the entire release_package folder")
         print("3. Users can follow INSTALLATION.md instructions")
         
@@ -3,73 +3,358 @@
 Cash Balance Tracker GUI
 
 A simple graphical interface for analyzing trading data with 10% dynamic position sizing.
-Supports CSV, Excel (.xlsx, .xls) files.
+Supports CSV, Excel (.xlsx, .xls, .xlsb) files.
 
 Usage: python cash_balance_gui.py
 """
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
-import pandas as pd
 import os
 import sys
 import platform
 from datetime import datetime
-import threading
-
-# Import our cash balance functions
-from cash_balance_tracker import (
-    load_csv_trade_data, 
-    load_excel_trade_data,
-    convert_trade_data_format,
-    calculate_dynamic_cash_balance, 
-    recalculate_trade_metrics,
-    run_benchmark_analysis
-)
-
-# Import HTML parsers
-try:
-    from parse_trading_data_html import parse_trading_data_html
-    from parse_spy_data import parse_spy_html_data
-    HTML_PARSERS_AVAILABLE = True
-except ImportError:
-    HTML_PARSERS_AVAILABLE = False
+import importlib.util
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# The analysis modules (cash_balance_tracker with pandas, numpy and numba, and the HTML
+# parsers) are imported by the worker functions below, so the GUI process starts without them
+
+# HTML input needs the HTML parser and BeautifulSoup; checked without importing them
+HTML_PARSERS_AVAILABLE = all(importlib.util.find_spec(name) is not None
+                             for name in ('parse_trading_data_html', 'bs4'))
+if not HTML_PARSERS_AVAILABLE:
     print("Warning: HTML parsers not available. HTML files will be disabled.")
 
-# Import visualization functions
-try:
-    from visualization import save_charts_to_files, display_charts
-    VISUALIZATION_AVAILABLE = True
-except ImportError:
-    VISUALIZATION_AVAILABLE = False
+# Charts need matplotlib and seaborn; like pyarrow below, they are only looked up here
+# and imported on the first "Show Charts" click so startup stays fast
+VISUALIZATION_AVAILABLE = all(importlib.util.find_spec(name) is not None
+                              for name in ('visualization', 'matplotlib', 'seaborn'))
+if not VISUALIZATION_AVAILABLE:
     print("Warning: Visualization module not available. Charts will be disabled.")
 
+# Operating system name ("Darwin", "Windows", "Linux"), looked up once for the window setup
+PLATFORM_SYSTEM = platform.system()
+
+# Parquet output (and the fast CSV writer) needs pyarrow; checked without importing it so startup stays fast
+PARQUET_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+# Parsed trades are also kept on disk as Parquet so reopening a file after a restart skips the parse
+TRADE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cashbalance_cache")
+TRADE_CACHE_MAX_FILES = 20
+# Bump whenever loading or cleaning changes the frame a file parses to, so older cache files are not reused
+TRADE_CACHE_VERSION = 1
+
+def _load_trades(file_path):
+    """Load trades from a CSV, Excel or HTML file based on its extension"""
+    from cash_balance_tracker import load_csv_trade_data, load_excel_trade_data
+    
+    file_ext = os.path.splitext(file_path)[1].lower()
+    
+    if file_ext == '.csv':
+        return load_csv_trade_data(file_path)
+    elif file_ext in ['.xlsx', '.xls', '.xlsb']:
+        return load_excel_trade_data(
+            file_path,
+            entry_time_col='EntryTime',
+            exit_time_col='ExitTime', 
+            entry_price_col='EntryPrice',
+            exit_price_col='ExitPrice',
+            ticker_col='Ticker'
+        )
+    elif file_ext == '.html':
+        if not HTML_PARSERS_AVAILABLE:
+            raise ImportError("HTML parsers not available. Please install required packages.")
+        from parse_trading_data_html import parse_trading_data_html
+        trades_df = parse_trading_data_html(file_path)
+        if trades_df.empty:
+            raise ValueError("No valid trading data found in HTML file")
+        return trades_df
+    else:
+        raise ValueError(f"Unsupported file format: {file_ext}. Please use CSV, .xlsx, .xls, .xlsb, or .html files.")
+
+# Columns of the updated trades the GUI shows; the full frame stays in the worker for saving
+DISPLAY_COLUMNS = ['EntryDate', 'Ticker', 'CashAvailable', 'PositionSize',
+                   'ActualShares', 'ActualCost', 'ActualPnL', 'ReturnPct']
+
+# Full results of the last successful analysis, kept in the worker process
+_last_results = {}
+
+# Parsed trades of the last file analyzed, keyed by (path, mtime, size); lives in the worker process
+_parse_cache = {}
+
+def _disk_cache_path(key):
+    """Parquet cache file for a (path, mtime, size) key, under the current TRADE_CACHE_VERSION"""
+    digest = hashlib.blake2b(repr((TRADE_CACHE_VERSION, key)).encode(), digest_size=8).hexdigest()
+    return os.path.join(TRADE_CACHE_DIR, f"{digest}.parquet")
+
+def _read_disk_cache(key):
+    """Return the cached trades for key, or None if there are none"""
+    cache_path = _disk_cache_path(key)
+    if not PARQUET_AVAILABLE or not os.path.exists(cache_path):
+        return None
+    import pandas as pd
+    try:
+        trades_df = pd.read_parquet(cache_path, engine='pyarrow')
+        # Touch the file so eviction drops the least recently used entries
+        os.utime(cache_path)
+        return trades_df
+    except Exception as e:
+        print(f"⚠️  Ignoring unreadable trade cache {cache_path}: {e}")
+        return None
+
+def _write_disk_cache(key, trades_df):
+    """Store parsed trades for key and evict the oldest entries beyond TRADE_CACHE_MAX_FILES"""
+    if not PARQUET_AVAILABLE or trades_df.empty:
+        return
+    cache_path = _disk_cache_path(key)
+    try:
+        os.makedirs(TRADE_CACHE_DIR, exist_ok=True)
+        # Write under a temporary name so a half-written file is never read back
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        trades_df.to_parquet(tmp_path, engine='pyarrow', compression='zstd')
+        os.replace(tmp_path, cache_path)
+        
+        entries = [entry for entry in os.scandir(TRADE_CACHE_DIR) if entry.name.endswith('.parquet')]
+        entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        for entry in entries[TRADE_CACHE_MAX_FILES:]:
+            os.remove(entry.path)
+    except Exception as e:
+        print(f"⚠️  Could not write trade cache {cache_path}: {e}")
+
+def _trades_key(file_path):
+    """Cache key identifying the current contents of a trade file"""
+    stat = os.stat(file_path)
+    return (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+
+def _load_trades_cached(file_path):
+    """Load trades, reusing the parsed frame (in memory, then on disk) while the file is unchanged"""
+    key = _trades_key(file_path)
+    trades_df = _parse_cache.get(key)
+    if trades_df is None:
+        trades_df = _read_disk_cache(key)
+        if trades_df is None:
+            trades_df = _load_trades(file_path)
+            _write_disk_cache(key, trades_df)
+        _parse_cache.clear()
+        _parse_cache[key] = trades_df
+    return trades_df
+
+def _analyze_file(file_path, starting_cash):
+    """
+    Load a trade file and run the cash balance analysis.
+    
+    Runs in the analysis worker process, so it must stay a picklable module-level function.
+    The full results are kept in the worker for _save_results; only the display columns
+    of the updated trades are sent back to the GUI.
+    
+    Returns:
+    tuple: (daily_balances DataFrame, updated_trades DataFrame with DISPLAY_COLUMNS)
+    """
+    from cash_balance_tracker import calculate_dynamic_cash_balance, recalculate_trade_metrics
+    
+    trades_df = _load_trades_cached(file_path)
+    daily_balances, final_positions = calculate_dynamic_cash_balance(trades_df, starting_cash)
+    updated_trades = recalculate_trade_metrics(trades_df, daily_balances)
+    _last_results['daily_balances'] = daily_balances
+    _last_results['updated_trades'] = updated_trades
+    _last_results['source'] = (_trades_key(file_path), starting_cash)
+    return daily_balances, updated_trades[DISPLAY_COLUMNS]
+
+def _analyze_benchmark(file_path, benchmark_file_path, starting_cash):
+    """
+    Run the strategy vs benchmark comparison; runs in the analysis worker process.
+    
+    Comparing right after an analysis of the same file and starting cash reuses its daily
+    balances and updated trades; otherwise the trades come from the parse cache and the
+    strategy is recalculated.
+    
+    Returns:
+    tuple: (strategy_results, benchmark_results, comparison_metrics) from run_benchmark_analysis
+    """
+    from cash_balance_tracker import run_benchmark_analysis
+    
+    if _last_results.get('source') == (_trades_key(file_path), starting_cash):
+        return run_benchmark_analysis(file_path, benchmark_file_path, starting_cash,
+                                      daily_balances=_last_results['daily_balances'],
+                                      updated_trades=_last_results['updated_trades'])
+    return run_benchmark_analysis(file_path, benchmark_file_path, starting_cash,
+                                  trades_df=_load_trades_cached(file_path))
+
+def _warm_up():
+    """Import the analysis modules and compile the numba kernels; runs in the analysis worker process"""
+    from cash_balance_tracker import warm_up_kernels
+    warm_up_kernels()
+
+def _write_csv(df, path):
+    """
+    Write a DataFrame to CSV, through pyarrow's multithreaded CSV writer when it is installed.
+    
+    Date-only timestamp columns are written as plain dates and categorical columns as their
+    values. The pyarrow output is not byte-identical to DataFrame.to_csv: the header and every
+    string cell are quoted ("Date", "AAPL") and whole floats are written without '.0'
+    (1000000, not 1000000.0), so pd.read_csv reads a float column holding only whole numbers
+    back as integers. Without pyarrow the file comes from to_csv.
+    """
+    if not PARQUET_AVAILABLE:
+        df.to_csv(path, index=False)
+        return
+    
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    for i, field in enumerate(table.schema):
+        if pa.types.is_dictionary(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(field.type.value_type))
+        elif pa.types.is_timestamp(field.type) and field.type.tz is None:
+            dates = df[field.name].dropna()
+            if dates.eq(dates.dt.normalize()).all():
+                table = table.set_column(i, field.name, table.column(i).cast(pa.date32()))
+    pa_csv.write_csv(table, path, pa_csv.WriteOptions(quoting_style='needed'))
+
+def _save_results(daily_file, trades_file, file_format):
+    """
+    Write the full results of the last analysis; runs in the analysis worker process.
+    
+    Parameters:
+    daily_file, trades_file: Output paths for the daily balances and updated trades
+    file_format: 'Parquet' (snappy, via pyarrow) or 'CSV'
+    """
+    for df, path in ((_last_results['daily_balances'], daily_file),
+                     (_last_results['updated_trades'], trades_file)):
+        if file_format == "Parquet":
+            df.to_parquet(path, engine='pyarrow', compression='snappy', index=False)
+        else:
+            _write_csv(df, path)
+
+# Summary part of the results report, filled in with format_map; the table slices follow it
+REPORT_TEMPLATE = """=== CASH BALANCE TRACKING ANALYSIS COMPLETE ===
+
+FILE ANALYZED: {file_name}
+ANALYSIS DATE: {analysis_date}
+
+=== SUMMARY STATISTICS ===
+Starting Cash:           ${starting_cash:,.2f}
+Final Portfolio Value:   ${final_portfolio_value:,.2f}
+Total Return:            {total_return:.2f}%
+Total P&L:              ${total_pnl:,.2f}
+Total Trades:           {total_trades:,}
+Winning Trades:         {winning_trades:,}
+Win Rate:               {win_rate:.1f}%
+Average P&L per Trade:  ${avg_pnl:,.2f}
+
+=== ADDITIONAL INSIGHTS ===
+Date Range:             {first_date} to {last_date}
+Number of Days:         {n_days:,}
+Maximum Cash Balance:   ${max_cash:,.2f}
+Minimum Cash Balance:   ${min_cash:,.2f}
+Maximum Active Positions: {max_active}
+
+=== FIRST 10 DAILY CASH BALANCES ===
+"""
+
+# Cell formats for the table previews in the results report; other columns use str.format's default
+PREVIEW_FORMATS = {
+    'Date': '{:%Y-%m-%d}',
+    'EntryDate': '{:%Y-%m-%d}',
+    'CashBalance': '{:,.2f}',
+    'PositionValue': '{:,.2f}',
+    'TotalPortfolio': '{:,.2f}',
+    'CashAvailable': '{:,.2f}',
+    'PositionSize': '{:,.2f}',
+    'ActualShares': '{:,}',
+    'ActualCost': '{:,.2f}',
+    'ActualPnL': '{:,.2f}',
+    'ReturnPct': '{:.2f}',
+}
+
+def _fmt_preview(df):
+    """
+    Format a small DataFrame slice as a right-aligned text table.
+    
+    Parameters:
+    df (pd.DataFrame): Rows to show, usually a head/tail slice
+    
+    Returns:
+    str: Header line followed by one line per row
+    """
+    cols = list(df.columns)
+    fmts = [PREVIEW_FORMATS.get(col, '{}').format for col in cols]
+    # NaN/NaT compare unequal to themselves and are shown as NaN
+    rows = [[fmt(value) if value == value else 'NaN' for fmt, value in zip(fmts, row)]
+            for row in df.itertuples(index=False, name=None)]
+    widths = [max([len(col)] + [len(row[i]) for row in rows]) for i, col in enumerate(cols)]
+    lines = ["  ".join(col.rjust(width) for col, width in zip(cols, widths))]
+    lines.extend("  ".join(cell.rjust(width) for cell, width in zip(row, widths)) for row in rows)
+    return "\n".join(lines)
+
+# Lines inserted into the results pane between screen refreshes
+RESULTS_FLUSH_LINES = 1000
+
+REPORT_FOOTER = """
+
+=== ANALYSIS COMPLETE ===
+✓ Each position allocated exactly 10% of available cash
+✓ Daily cash balance tracked for every day
+✓ Realistic trade results with whole share constraints
+✓ Ready to save results to files
+
+Click 'Save Results' to export data to Parquet or CSV files.
+"""
+
+# Shown in the results pane by Clear Results
+CLEARED_MESSAGE = """Results cleared. Ready for new analysis.
+
+Select a trading data file and click 'Analyze Trading Data' to begin."""
+
 class CashBalanceGUI:
     def __init__(self, root):
         self.root = root
         self.root.title("Cash Balance Tracker - 10% Dynamic Position Sizing")
         
-        # Thread management
-        self.active_threads = []
         self.is_closing = False
         
+        # The numeric analysis runs in a worker process so it never holds the GUI's GIL
+        self._pool = ProcessPoolExecutor(max_workers=1)
+        self._future = None
+        self._benchmark_future = None
+        self._save_future = None
+        self._analysis_running = False
+        self._benchmark_running = False
+        self._save_running = False
+        
+        # Last state set on each action button (all start disabled), so only real changes reach Tk
+        self._analyze_enabled = False
+        self._benchmark_enabled = False
+        self._charts_enabled = False
+        self._save_enabled = False
+        
         # Detect platform for better compatibility
-        self.is_macos = platform.system() == "Darwin"
-        self.is_windows = platform.system() == "Windows"
-        self.is_linux = platform.system() == "Linux"
+        self.is_macos = PLATFORM_SYSTEM == "Darwin"
+        self.is_windows = PLATFORM_SYSTEM == "Windows"
+        self.is_linux = PLATFORM_SYSTEM == "Linux"
         
-        # Platform-specific sizing
+        # Platform-specific sizing, centered on screen with a single geometry call
         if self.is_macos:
-            self.root.geometry("850x750")  # Slightly larger on macOS
+            width, height = 850, 750  # Slightly larger on macOS
         else:
-            self.root.geometry("800x700")
+            width, height = 800, 700
+        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
+        y = (self.root.winfo_screenheight() // 2) - (height // 2)
+        self.root.geometry(f"{width}x{height}+{x}+{y}")
         
         # Variables
         self.file_path = tk.StringVar()
         self.benchmark_file_path = tk.StringVar()
         self.starting_cash = tk.StringVar(value="1000000")
+        self.save_format = tk.StringVar(value="Parquet" if PARQUET_AVAILABLE else "CSV")
         self.daily_balances = None
         self.updated_trades = None
+        self._analyzed_name = None
         self.benchmark_data = None
         self.comparison_metrics = None
         
@@ -79,6 +364,16 @@ class CashBalanceGUI:
         
         self.setup_gui()
         
+        # Parse the starting cash as it is typed so Analyze only has to read the result
+        self._cash_value = None
+        self._cash_error = None
+        self.starting_cash.trace_add('write', self._revalidate_cash)
+        self._revalidate_cash()
+        
+        # Start the worker, load the analysis modules and compile the numba cash sweep there
+        # so the first analysis does not wait for them
+        self._pool.submit(_warm_up)
+        
         # Set up cleanup handlers
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
@@ -100,7 +395,7 @@ class CashBalanceGUI:
         messagebox.showinfo("Preferences", 
                            "Cash Balance Tracker v1.0\n\n"
                            "Adjust starting cash in the main window.\n"
-                           "Supported formats: CSV, Excel (.xlsx, .xls)")
+                           "Supported formats: CSV, Excel (.xlsx, .xls, .xlsb)")
         
     def setup_gui(self):
         """Setup the GUI components"""
@@ -133,7 +428,7 @@ class CashBalanceGUI:
         self.browse_button.grid(row=0, column=2)
         
         # Supported formats info
-        formats_label = ttk.Label(file_frame, text="Supported formats: CSV (recommended), Excel (.xlsx, .xls), HTML", 
+        formats_label = ttk.Label(file_frame, text="Supported formats: CSV (recommended), Excel (.xlsx, .xls, .xlsb), HTML", 
                                  font=("Arial", 9), foreground="gray")
         formats_label.grid(row=1, column=0, columnspan=3, sticky=tk.W, pady=(5, 0))
         
@@ -169,6 +464,13 @@ class CashBalanceGUI:
         cash_entry = ttk.Entry(settings_frame, textvariable=self.starting_cash, width=15)
         cash_entry.grid(row=0, column=1, sticky=tk.W)
         
+        ttk.Label(settings_frame, text="Save Format:").grid(row=0, column=2, sticky=tk.W, padx=(20, 10))
+        
+        save_formats = ["Parquet", "CSV"] if PARQUET_AVAILABLE else ["CSV"]
+        format_combo = ttk.Combobox(settings_frame, textvariable=self.save_format, values=save_formats,
+                                    state="readonly", width=8)
+        format_combo.grid(row=0, column=3, sticky=tk.W)
+        
         # Column mapping section
         mapping_frame = ttk.LabelFrame(main_frame, text="Column Mapping (Auto-detected)", padding="10")
         mapping_frame.grid(row=4, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 10))
@@ -185,7 +487,8 @@ class CashBalanceGUI:
         button_frame.grid(row=5, column=0, columnspan=3, pady=(0, 10))
         
         self.analyze_button = ttk.Button(button_frame, text="Analyze Trading Data", 
-                                        command=self.analyze_data, style="Accent.TButton")
+                                        command=self.analyze_data, style="Accent.TButton",
+                                        state="disabled")
         self.analyze_button.pack(side=tk.LEFT, padx=(0, 10))
         
         self.benchmark_button = ttk.Button(button_frame, text="Compare vs Benchmark", 
@@ -221,8 +524,10 @@ class CashBalanceGUI:
         main_frame.rowconfigure(8, weight=1)
         
         # Results text area with scrollbar
+        # Read-only report pane: no undo history is kept for the text it is refilled with
         self.results_text = scrolledtext.ScrolledText(results_frame, height=20, width=80, 
-                                                     font=("Consolas", 9))
+                                                     font=("Consolas", 9),
+                                                     undo=False, maxundo=0)
         self.results_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # Initial message
@@ -249,14 +554,34 @@ The tool will automatically:
 ✓ Recalculate all trades with realistic position sizes
 ✓ Provide comprehensive trading statistics
 """
-        self.results_text.insert(tk.END, initial_msg)
+        self._set_results_text(initial_msg)
+        
+    def _set_results_text(self, *parts):
+        """
+        Replace the results text, inserting the parts one after another.
+        
+        The widget is read-only in between. Long reports are flushed to the screen every
+        RESULTS_FLUSH_LINES lines so the first sections show up while the rest is inserted.
+        """
+        self.results_text.config(state="normal")
+        try:
+            self.results_text.delete(1.0, tk.END)
+            pending_lines = 0
+            for part in parts:
+                self.results_text.insert(tk.END, part)
+                pending_lines += part.count("\n")
+                if pending_lines >= RESULTS_FLUSH_LINES:
+                    self.results_text.update_idletasks()
+                    pending_lines = 0
+        finally:
+            self.results_text.config(state="disabled")
         
     def browse_file(self):
         """Open file dialog to select trading data file"""
         filetypes = [
-            ("All Supported", "*.csv *.xlsx *.xls *.html"),
+            ("All Supported", "*.csv *.xlsx *.xls *.xlsb *.html"),
             ("CSV files", "*.csv"),
-            ("Excel files", "*.xlsx *.xls"),
+            ("Excel files", "*.xlsx *.xls *.xlsb"),
             ("HTML files", "*.html"),
             ("All files", "*.*")
         ]
@@ -290,82 +615,108 @@ The tool will automatically:
         """Update status message"""
         self.status_var.set(message)
         self.status_label.config(foreground=color)
-        self.root.update_idletasks()
+        
+    def _revalidate_cash(self, *args):
+        """Parse the starting cash amount; Analyze is disabled while it is invalid"""
+        was_valid = self._cash_value is not None
+        try:
+            value = float(self.starting_cash.get().replace(",", ""))
+            if value <= 0:
+                raise ValueError("Starting cash must be positive")
+            self._cash_value, self._cash_error = value, None
+        except ValueError as e:
+            self._cash_value, self._cash_error = None, f"Invalid starting cash amount: {e}"
+        
+        if self._analysis_running:
+            return
+        # _set_btn only reaches Tk when validity flips, not on every keystroke
+        self._set_btn(self.analyze_button, '_analyze_enabled', self._can_analyze())
+        if self._cash_error:
+            self.update_status(self._cash_error, "red")
+        elif not was_valid:
+            self.update_status("Ready to analyze trading data...", "green")
+            
+    def _can_analyze(self):
+        """Analyze is available when the starting cash amount is valid and no analysis is running"""
+        return self._cash_value is not None and not self._analysis_running
+        
+    def _can_benchmark(self):
+        """Compare is available once a file has been analyzed and no comparison is running"""
+        return self._analyzed_name is not None and not self._benchmark_running
+        
+    def _can_save(self):
+        """Save is available when there are results and the worker is not busy with other jobs"""
+        busy = self._analysis_running or self._benchmark_running or self._save_running
+        return self.updated_trades is not None and not busy
+        
+    def _set_btn(self, btn, flag_name, want):
+        """Enable or disable a button, skipping the Tk configure call when its state is unchanged"""
+        if getattr(self, flag_name) == want:
+            return
+        btn.config(state="normal" if want else "disabled")
+        setattr(self, flag_name, want)
+        
+    def _refresh_buttons(self):
+        """Bring every action button in line with the current results and running jobs"""
+        self._set_btn(self.analyze_button, '_analyze_enabled', self._can_analyze())
+        self._set_btn(self.benchmark_button, '_benchmark_enabled', self._can_benchmark())
+        self._set_btn(self.charts_button, '_charts_enabled', self.comparison_metrics is not None)
+        self._set_btn(self.save_button, '_save_enabled', self._can_save())
         
     def analyze_data(self):
         """Analyze the selected trading data file"""
-        if not self.file_path.get():
+        if self._analysis_running:
+            return
+        file_path = self.file_path.get()
+        if not file_path:
             messagebox.showerror("Error", "Please select a trading data file first.")
             return
             
-        if not os.path.exists(self.file_path.get()):
+        if not os.path.exists(file_path):
             messagebox.showerror("Error", "Selected file does not exist.")
             return
             
-        try:
-            starting_cash = float(self.starting_cash.get().replace(",", ""))
-            if starting_cash <= 0:
-                raise ValueError("Starting cash must be positive")
-        except ValueError as e:
-            messagebox.showerror("Error", f"Invalid starting cash amount: {e}")
+        starting_cash = self._cash_value
+        if starting_cash is None:
+            messagebox.showerror("Error", self._cash_error)
             return
             
-        # Disable button and start progress
-        self.analyze_button.config(state="disabled")
+        # Disable buttons and start progress; saving waits until the new results are in
+        self._analysis_running = True
+        self._refresh_buttons()
         self.progress.start()
         self.update_status("Loading and analyzing data...", "blue")
         
-        # Run analysis in separate thread to prevent GUI freezing
-        thread = threading.Thread(target=self._run_analysis, args=(starting_cash,))
-        thread.daemon = True
-        self.active_threads.append(thread)
-        thread.start()
+        # Run analysis in the worker process and poll for the result to keep the GUI responsive
+        self._future = self._submit(_analyze_file, file_path, starting_cash)
+        self.root.after(50, self._poll_analysis, file_path, starting_cash)
+        
+    def _restart_worker(self):
+        """Start a fresh worker after the last one died (e.g. out of memory)"""
+        self._pool = ProcessPoolExecutor(max_workers=1)
+        # The full results lived in the dead worker, so they can no longer be saved
+        self.daily_balances = None
+        self.updated_trades = None
         
-    def _run_analysis(self, starting_cash):
-        """Run the actual analysis in a separate thread"""
+    def _submit(self, fn, *args):
+        """Submit work to the analysis worker, starting a new one if the last one died"""
         try:
-            file_path = self.file_path.get()
-            file_ext = os.path.splitext(file_path)[1].lower()
-            
-            # Load data based on file type
-            self.update_status("Loading file...", "blue")
-            
-            if file_ext == '.csv':
-                trades_df = load_csv_trade_data(file_path)
-            elif file_ext in ['.xlsx', '.xls']:
-                trades_df = load_excel_trade_data(
-                    file_path,
-                    entry_time_col='EntryTime',
-                    exit_time_col='ExitTime', 
-                    entry_price_col='EntryPrice',
-                    exit_price_col='ExitPrice',
-                    ticker_col='Ticker'
-                )
-            elif file_ext == '.html':
-                if not HTML_PARSERS_AVAILABLE:
-                    raise ImportError("HTML parsers not available. Please install required packages.")
-                trades_df = parse_trading_data_html(file_path)
-                if trades_df.empty:
-                    raise ValueError("No valid trading data found in HTML file")
-            else:
-                raise ValueError(f"Unsupported file format: {file_ext}. Please use CSV, .xlsx, .xls, or .html files.")
-                
-            self.update_status("Calculating daily cash balances...", "blue")
-            
-            # Calculate daily cash balances
-            self.daily_balances, final_positions = calculate_dynamic_cash_balance(
-                trades_df, starting_cash
-            )
-            
-            self.update_status("Recalculating trade metrics...", "blue")
-            
-            # Recalculate trade metrics
-            self.updated_trades = recalculate_trade_metrics(trades_df, self.daily_balances)
-            
-            # Display results on main thread
-            if not self.is_closing:
-                self.root.after(0, self._display_results, starting_cash)
-            
+            return self._pool.submit(fn, *args)
+        except BrokenProcessPool:
+            self._restart_worker()
+            return self._pool.submit(fn, *args)
+        
+    def _poll_analysis(self, file_path, starting_cash):
+        """Check the analysis worker from the Tk event loop and show its result when done"""
+        if self.is_closing:
+            return
+        if not self._future.done():
+            self.root.after(50, self._poll_analysis, file_path, starting_cash)
+            return
+        self._analysis_running = False
+        
+        try:
+            self.daily_balances, self.updated_trades = self._future.result()
         except ImportError as e:
             if "openpyxl" in str(e).lower():
                 error_msg = ("Excel file support not available. Please install openpyxl:\n\n"
@@ -373,26 +724,31 @@ The tool will automatically:
                            "Or save your Excel file as CSV format instead.")
             else:
                 error_msg = f"Missing required library: {str(e)}"
-            if not self.is_closing:
-                self.root.after(0, self._show_error, error_msg)
-            
+            self._show_error(error_msg)
+            return
+        except BrokenProcessPool:
+            self._restart_worker()
+            self._show_error("Error analyzing data: the analysis process stopped unexpectedly")
+            return
         except Exception as e:
-            error_msg = f"Error analyzing data: {str(e)}"
-            if not self.is_closing:
-                self.root.after(0, self._show_error, error_msg)
-        finally:
-            # Clean up thread reference
-            if hasattr(self, 'active_threads'):
-                current_thread = threading.current_thread()
-                if current_thread in self.active_threads:
-                    self.active_threads.remove(current_thread)
+            self._show_error(f"Error analyzing data: {str(e)}")
+            return
+        
+        # Name the results after the file that was analyzed, even if the entry has changed since
+        self._analyzed_name = os.path.basename(file_path)
+        self._display_results(starting_cash)
+            
+    def _stop_progress(self):
+        """Stop the progress bar once neither an analysis nor a comparison is still running"""
+        if not (self._analysis_running or self._benchmark_running):
+            self.progress.stop()
             
     def _show_error(self, error_msg):
         """Show error message on main thread"""
         if self.is_closing:
             return
-        self.progress.stop()
-        self.analyze_button.config(state="normal")
+        self._stop_progress()
+        self._refresh_buttons()
         self.update_status("Error occurred", "red")
         messagebox.showerror("Analysis Error", error_msg)
     
@@ -400,14 +756,15 @@ The tool will automatically:
         """Handle window closing event"""
         self.is_closing = True
         
-        # Stop all active threads
-        for thread in self.active_threads:
-            if thread.is_alive():
-                # Note: We can't forcefully stop threads, but we can mark them for cleanup
-                pass
-        
-        # Clear active threads list
-        self.active_threads.clear()
+        # Stop the analysis worker without waiting for a running analysis; shutdown alone
+        # would still hold up the interpreter's exit until the worker finished its task
+        if hasattr(self._pool, 'terminate_workers'):  # Python 3.14+
+            self._pool.terminate_workers()
+        else:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            # The pool's workers are this process's only multiprocessing children
+            for worker in multiprocessing.active_children():
+                worker.terminate()
         
         # Destroy the window
         self.root.destroy()
@@ -418,72 +775,58 @@ The tool will automatically:
             return
         try:
             # Stop progress and re-enable button
-            self.progress.stop()
-            self.analyze_button.config(state="normal")
-            self.save_button.config(state="normal")
-            self.benchmark_button.config(state="normal")
-            
-            # Clear previous results
-            self.results_text.delete(1.0, tk.END)
+            self._stop_progress()
+            self._refresh_buttons()
             
-            # Calculate summary statistics
-            total_trades = len(self.updated_trades)
-            winning_trades = len(self.updated_trades[self.updated_trades['ActualPnL'] > 0])
+            # Calculate summary statistics from plain arrays, one pass per column
+            pnl = self.updated_trades['ActualPnL'].to_numpy()
+            cash = self.daily_balances['CashBalance'].to_numpy()
+            total_trades = pnl.size
+            n_days = len(self.daily_balances)
+            winning_trades = int((pnl > 0).sum())
             win_rate = (winning_trades / total_trades) * 100 if total_trades > 0 else 0
-            total_pnl = self.updated_trades['ActualPnL'].sum()
-            final_portfolio_value = self.daily_balances['TotalPortfolio'].iloc[-1]
+            total_pnl = pnl.sum()
+            final_portfolio_value = self.daily_balances['TotalPortfolio'].to_numpy()[-1]
             total_return = ((final_portfolio_value - starting_cash) / starting_cash) * 100
             avg_pnl = total_pnl / total_trades if total_trades > 0 else 0
+            first_date = self.daily_balances['Date'].iloc[0].date()
+            last_date = self.daily_balances['Date'].iloc[-1].date()
+            max_active = self.daily_balances['ActivePositions'].to_numpy().max()
             
-            # Format results
-            results = f"""=== CASH BALANCE TRACKING ANALYSIS COMPLETE ===
-
-FILE ANALYZED: {os.path.basename(self.file_path.get())}
-ANALYSIS DATE: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-=== SUMMARY STATISTICS ===
-Starting Cash:           ${starting_cash:,.2f}
-Final Portfolio Value:   ${final_portfolio_value:,.2f}
-Total Return:            {total_return:.2f}%
-Total P&L:              ${total_pnl:,.2f}
-Total Trades:           {total_trades:,}
-Winning Trades:         {winning_trades:,}
-Win Rate:               {win_rate:.1f}%
-Average P&L per Trade:  ${avg_pnl:,.2f}
-
-=== ADDITIONAL INSIGHTS ===
-Date Range:             {self.daily_balances['Date'].min().date()} to {self.daily_balances['Date'].max().date()}
-Number of Days:         {len(self.daily_balances):,}
-Maximum Cash Balance:   ${self.daily_balances['CashBalance'].max():,.2f}
-Minimum Cash Balance:   ${self.daily_balances['CashBalance'].min():,.2f}
-Maximum Active Positions: {self.daily_balances['ActivePositions'].max()}
-
-=== FIRST 10 DAILY CASH BALANCES ===
-{self.daily_balances.head(10).to_string(index=False)}
-
-=== LAST 10 DAILY CASH BALANCES ===
-{self.daily_balances.tail(10).to_string(index=False)}
-
-=== FIRST 10 UPDATED TRADES (with 10% Position Sizing) ===
-{self.updated_trades[['EntryDate', 'Ticker', 'CashAvailable', 'PositionSize', 'ActualShares', 'ActualCost', 'ActualPnL', 'ReturnPct']].head(10).to_string(index=False)}
-
-=== ANALYSIS COMPLETE ===
-✓ Each position allocated exactly 10% of available cash
-✓ Daily cash balance tracked for every day
-✓ Realistic trade results with whole share constraints
-✓ Ready to save results to files
-
-Click 'Save Results' to export data to CSV files.
-"""
-            
-            self.results_text.insert(tk.END, results)
-            self.update_status(f"Analysis complete! Processed {total_trades:,} trades over {len(self.daily_balances):,} days.", "green")
+            # Insert the report section by section instead of assembling it into one string first
+            self._set_results_text(
+                REPORT_TEMPLATE.format_map({
+                    'file_name': self._analyzed_name,
+                    'analysis_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                    'starting_cash': starting_cash,
+                    'final_portfolio_value': final_portfolio_value,
+                    'total_return': total_return,
+                    'total_pnl': total_pnl,
+                    'total_trades': total_trades,
+                    'winning_trades': winning_trades,
+                    'win_rate': win_rate,
+                    'avg_pnl': avg_pnl,
+                    'first_date': first_date,
+                    'last_date': last_date,
+                    'n_days': n_days,
+                    'max_cash': cash.max(),
+                    'min_cash': cash.min(),
+                    'max_active': max_active,
+                }),
+                _fmt_preview(self.daily_balances.head(10)),
+                "\n\n=== LAST 10 DAILY CASH BALANCES ===\n",
+                _fmt_preview(self.daily_balances.tail(10)),
+                "\n\n=== FIRST 10 UPDATED TRADES (with 10% Position Sizing) ===\n",
+                _fmt_preview(self.updated_trades.head(10)),
+                REPORT_FOOTER,
+            )
+            self.update_status(f"Analysis complete! Processed {total_trades:,} trades over {n_days:,} days.", "green")
             
         except Exception as e:
             self._show_error(f"Error displaying results: {str(e)}")
             
     def save_results(self):
-        """Save analysis results to CSV files"""
+        """Save analysis results to Parquet or CSV files"""
         if self.daily_balances is None or self.updated_trades is None:
             messagebox.showerror("Error", "No results to save. Please run analysis first.")
             return
@@ -493,23 +836,43 @@ Click 'Save Results' to export data to CSV files.
         if not save_dir:
             return
             
+        # Generate filename prefix
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        base_name = os.path.splitext(self._analyzed_name)[0]
+        
+        # Parquet keeps dtypes and writes much faster than CSV on large results
+        file_format = "Parquet" if self.save_format.get() == "Parquet" and PARQUET_AVAILABLE else "CSV"
+        ext = ".parquet" if file_format == "Parquet" else ".csv"
+        
+        daily_file = os.path.join(save_dir, f"{base_name}_daily_cash_balances_{timestamp}{ext}")
+        trades_file = os.path.join(save_dir, f"{base_name}_updated_trades_10percent_{timestamp}{ext}")
+        summary_file = os.path.join(save_dir, f"{base_name}_analysis_summary_{timestamp}.txt")
+        # Take the summary now so it matches the results being saved, even if the pane changes meanwhile
+        summary_text = self.results_text.get(1.0, tk.END)
+        
+        # Save daily balances and updated trades from the full results held by the worker,
+        # polling for completion so the window stays responsive
+        self._save_running = True
+        self._refresh_buttons()
+        self.update_status("Saving results...", "blue")
+        self._save_future = self._submit(_save_results, daily_file, trades_file, file_format)
+        self.root.after(50, self._poll_save, save_dir, daily_file, trades_file, summary_file, summary_text)
+        
+    def _poll_save(self, save_dir, daily_file, trades_file, summary_file, summary_text):
+        """Check the save job from the Tk event loop and write the summary once the data files exist"""
+        if self.is_closing:
+            return
+        if not self._save_future.done():
+            self.root.after(50, self._poll_save, save_dir, daily_file, trades_file, summary_file, summary_text)
+            return
+        self._save_running = False
+        
         try:
-            # Generate filename prefix
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            base_name = os.path.splitext(os.path.basename(self.file_path.get()))[0]
-            
-            # Save daily balances
-            daily_file = os.path.join(save_dir, f"{base_name}_daily_cash_balances_{timestamp}.csv")
-            self.daily_balances.to_csv(daily_file, index=False)
-            
-            # Save updated trades
-            trades_file = os.path.join(save_dir, f"{base_name}_updated_trades_10percent_{timestamp}.csv")
-            self.updated_trades.to_csv(trades_file, index=False)
+            self._save_future.result()
             
             # Save summary report
-            summary_file = os.path.join(save_dir, f"{base_name}_analysis_summary_{timestamp}.txt")
             with open(summary_file, 'w') as f:
-                f.write(self.results_text.get(1.0, tk.END))
+                f.write(summary_text)
                 
             success_msg = f"""Results saved successfully!
 
@@ -520,87 +883,95 @@ Files created:
 
 Location: {save_dir}"""
             
+            self._refresh_buttons()
             messagebox.showinfo("Save Complete", success_msg)
             self.update_status(f"Results saved to {save_dir}", "green")
             
+        except BrokenProcessPool:
+            self._restart_worker()
+            self._refresh_buttons()
+            self.update_status("Error saving results", "red")
+            messagebox.showerror("Save Error", "Error saving results: the analysis process stopped unexpectedly. "
+                                               "Please run the analysis again.")
         except Exception as e:
+            self._refresh_buttons()
+            self.update_status("Error saving results", "red")
             messagebox.showerror("Save Error", f"Error saving results: {str(e)}")
             
     def analyze_benchmark(self):
         """Run benchmark analysis comparing strategy vs SPY/QQQ"""
-        if not self.file_path.get():
+        if self._benchmark_running:
+            return
+        file_path = self.file_path.get()
+        benchmark_file_path = self.benchmark_file_path.get()
+        if not file_path:
             messagebox.showerror("Error", "Please analyze trading data first.")
             return
             
-        if not self.benchmark_file_path.get():
+        if not benchmark_file_path:
             messagebox.showerror("Error", "Please select a benchmark data file first.")
             return
             
-        if not os.path.exists(self.benchmark_file_path.get()):
+        if not os.path.exists(benchmark_file_path):
             messagebox.showerror("Error", "Selected benchmark file does not exist.")
             return
         
-        # Disable button and start progress
-        self.benchmark_button.config(state="disabled")
+        if self._cash_value is None:
+            messagebox.showerror("Error", self._cash_error)
+            return
+        
+        # Disable buttons and start progress; saving waits until the worker is free again
+        self._benchmark_running = True
+        self._refresh_buttons()
         self.progress.start()
         self.update_status("Running benchmark analysis...", "blue")
         
-        # Run analysis in separate thread
-        thread = threading.Thread(target=self._run_benchmark_analysis)
-        thread.daemon = True
-        self.active_threads.append(thread)
-        thread.start()
+        # Run the comparison in the worker process, which already holds the parsed trades
+        self._benchmark_future = self._submit(_analyze_benchmark, file_path, benchmark_file_path,
+                                              self._cash_value)
+        self.root.after(50, self._poll_benchmark, file_path, benchmark_file_path)
+        
+    def _poll_benchmark(self, file_path, benchmark_file_path):
+        """Check the benchmark comparison from the Tk event loop and show its result when done"""
+        if self.is_closing:
+            return
+        if not self._benchmark_future.done():
+            self.root.after(50, self._poll_benchmark, file_path, benchmark_file_path)
+            return
+        self._benchmark_running = False
         
-    def _run_benchmark_analysis(self):
-        """Run benchmark analysis in separate thread"""
         try:
-            starting_cash = float(self.starting_cash.get().replace(',', ''))
-            
-            # Run benchmark analysis
-            strategy_data, benchmark_data, comparison_metrics = run_benchmark_analysis(
-                self.file_path.get(), 
-                self.benchmark_file_path.get(), 
-                starting_cash
-            )
-            
-            if strategy_data is not None and benchmark_data is not None and comparison_metrics:
-                self.benchmark_data = benchmark_data
-                self.comparison_metrics = comparison_metrics
-                if not self.is_closing:
-                    self.root.after(0, self._display_benchmark_results, comparison_metrics)
-            else:
-                if not self.is_closing:
-                    self.root.after(0, self._show_error, "Failed to run benchmark analysis")
-                
+            strategy_data, benchmark_data, comparison_metrics = self._benchmark_future.result()
+        except BrokenProcessPool:
+            self._restart_worker()
+            self._show_error("Error running benchmark analysis: the analysis process stopped unexpectedly")
+            return
         except Exception as e:
-            error_msg = f"Error running benchmark analysis: {str(e)}"
-            if not self.is_closing:
-                self.root.after(0, self._show_error, error_msg)
-        finally:
-            # Clean up thread reference
-            if hasattr(self, 'active_threads'):
-                current_thread = threading.current_thread()
-                if current_thread in self.active_threads:
-                    self.active_threads.remove(current_thread)
+            self._show_error(f"Error running benchmark analysis: {str(e)}")
+            return
+        
+        if strategy_data is not None and benchmark_data is not None and comparison_metrics:
+            self.benchmark_data = benchmark_data
+            self.comparison_metrics = comparison_metrics
+            self._display_benchmark_results(comparison_metrics, os.path.basename(file_path),
+                                            os.path.basename(benchmark_file_path))
+        else:
+            self._show_error("Failed to run benchmark analysis")
             
-    def _display_benchmark_results(self, comparison_metrics):
+    def _display_benchmark_results(self, comparison_metrics, file_name, benchmark_name):
         """Display benchmark comparison results on main thread"""
         if self.is_closing:
             return
         try:
             # Stop progress and re-enable button
-            self.progress.stop()
-            self.benchmark_button.config(state="normal")
-            self.charts_button.config(state="normal")
-            
-            # Clear previous results
-            self.results_text.delete(1.0, tk.END)
+            self._stop_progress()
+            self._refresh_buttons()
             
             # Format benchmark results
             results = f"""=== BENCHMARK COMPARISON ANALYSIS ===
 
-FILE ANALYZED: {os.path.basename(self.file_path.get())}
-BENCHMARK: {os.path.basename(self.benchmark_file_path.get())}
+FILE ANALYZED: {file_name}
+BENCHMARK: {benchmark_name}
 ANALYSIS DATE: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
 === PERFORMANCE COMPARISON ===
@@ -647,7 +1018,7 @@ Final Benchmark Value:    ${comparison_metrics['final_benchmark_value']:12,.2f}
             else:
                 results += f"✅ Your strategy had smaller maximum drawdown than the benchmark\n"
             
-            self.results_text.insert(tk.END, results)
+            self._set_results_text(results)
             self.update_status("Benchmark analysis complete!", "green")
             
         except Exception as e:
@@ -669,6 +1040,12 @@ Final Benchmark Value:    ${comparison_metrics['final_benchmark_value']:12,.2f}
             messagebox.showerror("Error", "Please run benchmark analysis first.")
             return
             
+        try:
+            from visualization import display_charts
+        except ImportError as e:
+            messagebox.showerror("Charts Not Available", f"Could not load the visualization module: {str(e)}")
+            return
+            
         try:
             # Display charts
             display_charts(self.daily_balances, self.benchmark_data, self.comparison_metrics)
@@ -688,84 +1065,56 @@ Final Benchmark Value:    ${comparison_metrics['final_benchmark_value']:12,.2f}
         self.updated_trades = None
         self.benchmark_data = None
         self.comparison_metrics = None
-        self.save_button.config(state="disabled")
-        self.benchmark_button.config(state="disabled")
-        self.charts_button.config(state="disabled")
+        self._analyzed_name = None
+        self._refresh_buttons()
         
         # Clear results text
-        self.results_text.delete(1.0, tk.END)
-        initial_msg = """Results cleared. Ready for new analysis.
-
-Select a trading data file and click 'Analyze Trading Data' to begin."""
-        self.results_text.insert(tk.END, initial_msg)
+        self._set_results_text(CLEARED_MESSAGE)
         
         self.update_status("Ready to analyze trading data...", "green")
 
+# Per-platform styling: preferred ttk themes (best first) and the Accent button color
+PLATFORM_STYLES = {
+    'Darwin': {'themes': ('aqua', 'clam', 'default'), 'accent': '#007AFF'},    # aqua if available, macOS blue
+    'Windows': {'themes': ('vista', 'winnative', 'clam'), 'accent': '#0078d4'}, # Windows blue
+}
+DEFAULT_PLATFORM_STYLE = {'themes': ('clam', 'alt'), 'accent': '#0078d4'}     # Linux/Unix
+
+def _pick_theme(themes, available):
+    """Return the first of the preferred ttk themes that is installed"""
+    for theme in themes:
+        if theme in available:
+            return theme
+    return 'default'
+
 def main():
     """Main function to run the GUI application"""
     root = tk.Tk()
     
-    # Detect platform
-    is_macos = platform.system() == "Darwin"
-    is_windows = platform.system() == "Windows"
+    is_macos = PLATFORM_SYSTEM == "Darwin"
     
-    # Set up platform-appropriate styling
+    # Set up platform-appropriate styling: one lookup of the installed themes, then a
+    # single theme_use instead of trying themes until one does not raise
+    platform_style = PLATFORM_STYLES.get(PLATFORM_SYSTEM, DEFAULT_PLATFORM_STYLE)
     style = ttk.Style()
-    
-    # Choose the best theme for each platform
-    if is_macos:
-        # macOS looks best with aqua theme if available
-        try:
-            style.theme_use('aqua')
-        except tk.TclError:
-            try:
-                style.theme_use('clam')
-            except tk.TclError:
-                style.theme_use('default')
-    elif is_windows:
-        # Windows looks good with vista or xpnative
-        try:
-            style.theme_use('vista')
-        except tk.TclError:
-            try:
-                style.theme_use('winnative')
-            except tk.TclError:
-                style.theme_use('clam')
-    else:
-        # Linux/Unix - use clam or alt
-        try:
-            style.theme_use('clam')
-        except tk.TclError:
-            style.theme_use('alt')
+    style.theme_use(_pick_theme(platform_style['themes'], style.theme_names()))
     
     # Configure custom styles with platform-appropriate colors
-    if is_macos:
-        style.configure('Accent.TButton', 
-                       foreground='white', 
-                       background='#007AFF')  # macOS blue
-    else:
-        style.configure('Accent.TButton', 
-                       foreground='white', 
-                       background='#0078d4')  # Windows blue
+    style.configure('Accent.TButton', 
+                   foreground='white', 
+                   background=platform_style['accent'])
     
     app = CashBalanceGUI(root)
     
-    # Center window on screen
-    root.update_idletasks()
-    width = root.winfo_width()
-    height = root.winfo_height()
-    x = (root.winfo_screenwidth() // 2) - (width // 2)
-    y = (root.winfo_screenheight() // 2) - (height // 2)
-    root.geometry(f"{width}x{height}+{x}+{y}")
-    
     # macOS-specific window setup
     if is_macos:
-        # Bring window to front on macOS
-        root.lift()
-        root.attributes('-topmost', True)
-        root.after_idle(root.attributes, '-topmost', False)
+        # Bring window to front on macOS and give it focus, without toggling -topmost;
+        # scheduled so it runs once mainloop has mapped the window
+        root.after(0, root.lift)
+        root.after(0, root.focus_force)
     
     root.mainloop()
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
@@ -2,14 +2,157 @@ import pandas as pd
 from datetime import datetime, timedelta
 import numpy as np
 import os
+import heapq
+import csv
+import codecs
+import warnings
+from collections import defaultdict
 
-def calculate_dynamic_cash_balance(trades_df, starting_cash=1000000):
+# Numba is optional: it compiles the cash sweep to machine code when installed
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# numexpr is optional: it fuses the per-trade P&L arithmetic without temporaries on large trade sets
+try:
+    import numexpr as ne
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+
+# Below this many trades plain numpy is faster than numexpr's dispatch overhead
+NUMEXPR_MIN_TRADES = 10000
+
+def _to_day_numbers(values):
+    """Convert datetime-like values to int64 days since the epoch (time of day dropped)"""
+    return np.asarray(values, dtype='datetime64[ns]').astype('datetime64[D]').view('i8')
+
+def _float_dtype(precision):
+    """Map a precision name ('float64' or 'float32') to its numpy dtype"""
+    if precision not in ('float64', 'float32'):
+        raise ValueError(f"precision must be 'float64' or 'float32', got '{precision}'")
+    return np.dtype(precision)
+
+@njit(cache=True)
+def _run_sweep(event_days, entry_days, exit_days, entry_px, exit_px, starting_cash):
+    """
+    Core cash sweep over plain numpy arrays (no Python objects, so it can be JIT-compiled).
+    
+    Parameters:
+    event_days: Sorted unique day numbers (int64 days since epoch) that have entries or exits
+    entry_days, exit_days: Entry/exit day number of each trade, sorted by entry
+    entry_px, exit_px: Entry/exit price of each trade
+    starting_cash: Initial cash balance
+    
+    Returns:
+    tuple: (out_cash, out_active, out_value, open_ids, open_shares)
+        - out_*: Cash, open position count and position value at the end of each event day
+        - open_ids, open_shares: Trade index and shares of each position still open at the end
+    """
+    n_trades = entry_days.shape[0]
+    n_events = event_days.shape[0]
+    out_cash = np.empty(n_events, dtype=np.float64)
+    out_active = np.empty(n_events, dtype=np.int32)
+    out_value = np.empty(n_events, dtype=np.float64)
+    
+    # Open positions as parallel columns; the first n_open slots are live (in no particular order)
+    open_ids = np.empty(n_trades, dtype=np.int64)
+    open_shares = np.empty(n_trades, dtype=np.int64)
+    open_entry_px = np.empty(n_trades, dtype=np.float64)
+    open_exit_px = np.empty(n_trades, dtype=np.float64)
+    slot_of = np.empty(n_trades, dtype=np.int64)
+    n_open = 0
+    
+    # Min-heap of (exit day, trade id) for positions that will exit
+    exit_heap = [(np.int64(0), np.int64(0))]
+    exit_heap.pop()
+    
+    cash_balance = starting_cash
+    position_value = 0.0
+    next_entry = 0
+    
+    for k in range(n_events):
+        current_day = event_days[k]
+        
+        # Check for exits FIRST (to free up cash for potential same-day re-entries),
+        # popping only the positions due today off the heap
+        while len(exit_heap) > 0 and exit_heap[0][0] <= current_day:
+            trade_id = heapq.heappop(exit_heap)[1]
+            s = slot_of[trade_id]
+            cash_balance += open_shares[s] * open_exit_px[s]
+            position_value -= open_shares[s] * open_entry_px[s]
+            
+            # Swap-and-pop: move the last open position into the freed slot
+            n_open -= 1
+            if s != n_open:
+                open_ids[s] = open_ids[n_open]
+                open_shares[s] = open_shares[n_open]
+                open_entry_px[s] = open_entry_px[n_open]
+                open_exit_px[s] = open_exit_px[n_open]
+                slot_of[open_ids[s]] = s
+            
+            # Start the running total afresh once everything is closed, so rounding cannot drift
+            if n_open == 0:
+                position_value = 0.0
+        
+        # New entries on this day, in entry order
+        while next_entry < n_trades and entry_days[next_entry] == current_day:
+            price = entry_px[next_entry]
+            if price > 0:
+                # Calculate position size (10% of available cash)
+                qty = int(cash_balance * 0.10 / price)
+                
+                # Only proceed if we can afford at least 1 share
+                if qty > 0:
+                    cash_balance -= qty * price
+                    position_value += qty * price
+                    open_ids[n_open] = next_entry
+                    open_shares[n_open] = qty
+                    open_entry_px[n_open] = price
+                    open_exit_px[n_open] = exit_px[next_entry]
+                    slot_of[next_entry] = n_open
+                    n_open += 1
+                    
+                    # A position that does not exit after its entry day is never closed
+                    if exit_days[next_entry] > current_day:
+                        heapq.heappush(exit_heap, (exit_days[next_entry], np.int64(next_entry)))
+            next_entry += 1
+        
+        # Position value at entry prices (mark-to-market would require daily prices),
+        # kept as a running total rather than re-summed over the open positions
+        out_cash[k] = cash_balance
+        out_active[k] = n_open
+        out_value[k] = position_value
+    
+    return out_cash, out_active, out_value, open_ids[:n_open], open_shares[:n_open]
+
+def warm_up_kernels():
+    """
+    Compile (or load from numba's cache) the JIT cash sweep ahead of the first analysis.
+    Does nothing when numba is not installed.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    days = np.zeros(1, dtype=np.int64)
+    prices = np.ones(1, dtype=np.float64)
+    _run_sweep(days, days, days + 1, prices, prices, 1.0)
+
+def calculate_dynamic_cash_balance(trades_df, starting_cash=1000000, verbose=False):
     """
     Calculate running cash balance where each position gets 10% of available cash at entry.
     
     Parameters:
     trades_df: DataFrame with columns ['EntryTime', 'ExitTime', 'EntryPrice', 'ExitPrice']
     starting_cash: Initial cash balance (default: $1,000,000)
+    verbose: Print the balances of the first few days (default: False)
     
     Returns:
     tuple: (daily_balance_df, active_positions_final)
@@ -20,138 +163,243 @@ def calculate_dynamic_cash_balance(trades_df, starting_cash=1000000):
     # Validate inputs
     validate_cash_balance_inputs(trades_df, starting_cash)
     
-    # Create a copy to avoid modifying original data
-    trades_df = trades_df.copy()
-    
-    # Convert date strings to datetime if they're not already
-    trades_df['EntryTime'] = pd.to_datetime(trades_df['EntryTime'])
-    trades_df['ExitTime'] = pd.to_datetime(trades_df['ExitTime'])
+    # Work on converted columns only; the input DataFrame is never copied or modified
+    entry_times = pd.to_datetime(trades_df['EntryTime'])
+    exit_times = pd.to_datetime(trades_df['ExitTime'])
     
     # Sort trades by entry time
-    trades_df = trades_df.sort_values('EntryTime').reset_index(drop=True)
+    order = np.argsort(entry_times.to_numpy())
+    entry_times = entry_times.iloc[order]
+    exit_times = exit_times.iloc[order]
     
     # Create date range from first entry to last exit
-    start_date = trades_df['EntryTime'].min()
-    end_date = trades_df['ExitTime'].max()
+    start_date = entry_times.min()
+    end_date = exit_times.max()
     date_range = pd.date_range(start=start_date, end=end_date, freq='D')
     
-    # Initialize daily tracking DataFrame
+    # Convert to plain arrays once; days are int64 day numbers so comparisons are integer compares
+    entry_days = _to_day_numbers(entry_times)
+    exit_days = _to_day_numbers(exit_times)
+    entry_px = trades_df['EntryPrice'].to_numpy(dtype=np.float64)[order]
+    exit_px = trades_df['ExitPrice'].to_numpy(dtype=np.float64)[order]
+    range_days = _to_day_numbers(date_range)
+    
+    # Only days with entries or exits inside the tracked range need simulating
+    # (NaT dates and exits before the first entry are never reached)
+    event_days = np.unique(np.concatenate([entry_days, exit_days]))
+    if len(range_days):
+        event_days = event_days[(event_days >= range_days[0]) & (event_days <= range_days[-1])]
+    else:
+        event_days = event_days[:0]
+    
+    snapshot_cash, snapshot_active, snapshot_value, open_ids, open_shares = _run_sweep(
+        event_days, entry_days, exit_days, entry_px, exit_px, float(starting_cash)
+    )
+    
+    # Expand the per-event snapshots to every calendar day: each day takes the state of the
+    # most recent event day at or before it (nothing changes in between)
+    # The range is one day per step, so a day number maps to its row by subtracting the first day;
+    # counting events per row and summing gives each day's last event
+    n_days = len(date_range)
+    first_day = range_days[0] if n_days else 0
+    events_per_day = np.bincount(event_days - first_day, minlength=n_days)
+    last_event = np.cumsum(events_per_day) - 1
+    has_event = last_event >= 0
+    
+    cash_arr = np.empty(n_days, dtype=np.float64)
+    active_arr = np.empty(n_days, dtype=np.int32)
+    posval_arr = np.empty(n_days, dtype=np.float64)
+    cash_arr[~has_event] = starting_cash
+    active_arr[~has_event] = 0
+    posval_arr[~has_event] = 0.0
+    cash_arr[has_event] = snapshot_cash[last_event[has_event]]
+    active_arr[has_event] = snapshot_active[last_event[has_event]]
+    posval_arr[has_event] = snapshot_value[last_event[has_event]]
+    total_arr = cash_arr + posval_arr
+    
     daily_balance = pd.DataFrame({
         'Date': date_range,
-        'CashBalance': starting_cash,
-        'ActivePositions': 0,
-        'PositionValue': 0.0,
-        'TotalPortfolio': starting_cash
-    })
+        'CashBalance': cash_arr,
+        'ActivePositions': active_arr,
+        'PositionValue': posval_arr,
+        'TotalPortfolio': total_arr
+    }, copy=False)
+    
+    # Debug output for first few days
+    for i in range(min(n_days, 6) if verbose else 0):
+        print(f"Date: {date_range[i].date()}, Cash: ${cash_arr[i]:,.2f}, Active Positions: {active_arr[i]}")
+    
+    # Any positions still open at the end of the range, back in entry order
+    keep_order = np.argsort(open_ids, kind='stable')
+    open_ids, open_shares = open_ids[keep_order], open_shares[keep_order]
+    active_positions = [{
+        'entry_date': entry_times.iat[j],
+        'exit_date': exit_times.iat[j],
+        'entry_price': entry_px[j],
+        'exit_price': exit_px[j],
+        'shares': int(qty),
+        'cost': qty * entry_px[j]
+    } for j, qty in zip(open_ids, open_shares)]
     
-    # Track active positions
-    active_positions = []
+    return daily_balance, active_positions
+
+def calculate_static_cash_balance(trades_df, starting_cash=1000000):
+    """
+    Calculate running cash balance where each position gets 10% of the STARTING cash at entry.
     
-    # Process each day
-    for i, current_date in enumerate(date_range):
-        # Start with previous day's cash balance, or starting cash for first day
-        if i == 0:
-            cash_balance = starting_cash
-        else:
-            cash_balance = daily_balance.iloc[i-1]['CashBalance']
-        
-        # Check for exits FIRST (to free up cash for potential same-day re-entries)
-        positions_to_remove = []
-        for j, position in enumerate(active_positions):
-            if position['exit_date'].date() == current_date.date():
-                # Sell position
-                sale_proceeds = position['shares'] * position['exit_price']
-                cash_balance += sale_proceeds
-                positions_to_remove.append(j)
-        
-        # Remove closed positions (in reverse order to maintain indices)
-        for j in reversed(positions_to_remove):
-            active_positions.pop(j)
-        
-        # Check for new entries on this date
-        new_entries = trades_df[trades_df['EntryTime'].dt.date == current_date.date()]
-        
-        for _, trade in new_entries.iterrows():
-            # Calculate position size (10% of available cash)
-            position_cash = cash_balance * 0.10
-            shares_to_buy = int(position_cash / trade['EntryPrice']) if trade['EntryPrice'] > 0 else 0
-            
-            # Only proceed if we can afford at least 1 share
-            if shares_to_buy > 0:
-                actual_cost = shares_to_buy * trade['EntryPrice']
-                
-                # Update cash balance
-                cash_balance -= actual_cost
-                
-                # Add to active positions
-                active_positions.append({
-                    'entry_date': current_date,
-                    'exit_date': trade['ExitTime'],
-                    'entry_price': trade['EntryPrice'],
-                    'exit_price': trade['ExitPrice'],
-                    'shares': shares_to_buy,
-                    'cost': actual_cost
-                })
-        
-        # Calculate current position value (mark-to-market would require daily prices)
-        # For now, we'll use entry prices as approximation
-        position_value = sum(pos['shares'] * pos['entry_price'] for pos in active_positions)
-        
-        # Update daily balance record
-        daily_balance.iloc[i] = {
-            'Date': current_date,
-            'CashBalance': cash_balance,
-            'ActivePositions': len(active_positions),
-            'PositionValue': position_value,
-            'TotalPortfolio': cash_balance + position_value
-        }
-        
-        # Debug output for first few days
-        if i <= 5:
-            print(f"Date: {current_date.date()}, Cash: ${cash_balance:,.2f}, Active Positions: {len(active_positions)}")
+    Unlike calculate_dynamic_cash_balance, position sizes do not compound: every trade is sized
+    from starting_cash, so trades are independent of each other and the whole calculation is
+    column math plus a cumulative sum. Use calculate_dynamic_cash_balance when sizing must
+    follow the available cash balance.
+    
+    Parameters:
+    trades_df: DataFrame with columns ['EntryTime', 'ExitTime', 'EntryPrice', 'ExitPrice']
+    starting_cash: Initial cash balance (default: $1,000,000)
+    
+    Returns:
+    tuple: (daily_balance_df, active_positions_final)
+        - daily_balance_df: DataFrame with daily cash balances and position tracking
+        - active_positions_final: List of any remaining open positions
+    """
+    
+    # Validate inputs
+    validate_cash_balance_inputs(trades_df, starting_cash)
+    
+    entry_times = pd.to_datetime(trades_df['EntryTime'])
+    exit_times = pd.to_datetime(trades_df['ExitTime'])
+    
+    # Create date range from first entry to last exit
+    date_range = pd.date_range(start=entry_times.min(), end=exit_times.max(), freq='D')
+    range_days = _to_day_numbers(date_range)
+    n_days = len(date_range)
+    
+    entry_days = _to_day_numbers(entry_times)
+    exit_days = _to_day_numbers(exit_times)
+    entry_px = trades_df['EntryPrice'].to_numpy(dtype=np.float64)
+    exit_px = trades_df['ExitPrice'].to_numpy(dtype=np.float64)
+    
+    # The range is one day per step starting at the first entry, so a day's row is its offset
+    entry_idx = entry_days - range_days[0]
+    exit_idx = exit_days - range_days[0]
+    # Entries and exits outside the range (including NaT dates) are never reached
+    entry_in_range = (entry_idx >= 0) & (entry_idx < n_days)
+    exit_in_range = (exit_idx >= 0) & (exit_idx < n_days)
+    
+    # Every trade is sized from starting cash; trades with no whole shares are skipped
+    shares = np.zeros(len(entry_px), dtype=np.int64)
+    priced = (entry_px > 0) & entry_in_range
+    shares[priced] = np.trunc(starting_cash * 0.10 / entry_px[priced])
+    taken = shares > 0
+    # A position that does not exit after its entry day is never closed
+    closes = taken & exit_in_range & (exit_days > entry_days)
+    
+    cost = shares * entry_px
+    proceeds = shares * exit_px
+    
+    # Scatter each trade's cash, open-count and cost changes onto its entry and exit days
+    cashflow = np.zeros(n_days, dtype=np.float64)
+    active_flow = np.zeros(n_days, dtype=np.int32)
+    value_flow = np.zeros(n_days, dtype=np.float64)
+    np.add.at(cashflow, entry_idx[taken], -cost[taken])
+    np.add.at(cashflow, exit_idx[closes], proceeds[closes])
+    np.add.at(active_flow, entry_idx[taken], 1)
+    np.add.at(active_flow, exit_idx[closes], -1)
+    np.add.at(value_flow, entry_idx[taken], cost[taken])
+    np.add.at(value_flow, exit_idx[closes], -cost[closes])
+    
+    cash_arr = starting_cash + np.cumsum(cashflow)
+    active_arr = np.cumsum(active_flow, dtype=np.int32)
+    posval_arr = np.cumsum(value_flow)
+    
+    daily_balance = pd.DataFrame({
+        'Date': date_range,
+        'CashBalance': cash_arr,
+        'ActivePositions': active_arr,
+        'PositionValue': posval_arr,
+        'TotalPortfolio': cash_arr + posval_arr
+    }, copy=False)
+    
+    # Any positions still open at the end of the range
+    active_positions = [{
+        'entry_date': entry_times.iat[j],
+        'exit_date': exit_times.iat[j],
+        'entry_price': entry_px[j],
+        'exit_price': exit_px[j],
+        'shares': int(shares[j]),
+        'cost': cost[j]
+    } for j in np.flatnonzero(taken & ~closes)]
     
     return daily_balance, active_positions
 
-def recalculate_trade_metrics(trades_df, daily_balance_df):
+def recalculate_trade_metrics(trades_df, daily_balance_df, precision='float64'):
     """
     Recalculate trade metrics based on dynamic position sizing
+    
+    precision: 'float64' (default) or 'float32' for the price and money columns. Cash balances
+               used for position sizing are always read as float64; float32 halves the memory
+               of the result for very large trade sets at the cost of cent-level rounding.
     """
-    results = []
+    float_dtype = _float_dtype(precision)
+    entry_times = pd.to_datetime(trades_df['EntryTime'])
+    exit_times = pd.to_datetime(trades_df['ExitTime'])
+    
+    # Find cash balance on each entry date with one binary search over the (sorted) daily dates
+    daily_days = _to_day_numbers(pd.to_datetime(daily_balance_df['Date']))
+    daily_cash = daily_balance_df['CashBalance'].to_numpy(dtype=np.float64)
+    trade_days = _to_day_numbers(entry_times)
+    if len(daily_days):
+        idx = np.minimum(np.searchsorted(daily_days, trade_days), len(daily_days) - 1)
+        found = daily_days[idx] == trade_days
+        entry_balance = daily_cash[idx]
+    else:
+        found = np.zeros(len(trade_days), dtype=bool)
+        entry_balance = np.full(len(trade_days), np.nan)
+    
+    # One aggregated warning instead of one line per unmatched trade
+    if not found.all():
+        missing_dates = sorted(set(entry_times[~found].dt.strftime('%Y-%m-%d')))
+        warnings.warn(f"No cash balance data found for {(~found).sum()} trades "
+                      f"(entry dates: {', '.join(missing_dates[:5])}{'...' if len(missing_dates) > 5 else ''})")
+    
+    entry_balance = entry_balance[found]
+    entry_px = trades_df['EntryPrice'].to_numpy(dtype=float_dtype)[found]
+    exit_px = trades_df['ExitPrice'].to_numpy(dtype=float_dtype)[found]
+    if 'Ticker' in trades_df.columns:
+        # Index the backing array so a categorical ticker column stays categorical
+        tickers = trades_df['Ticker'].array[found]
+    else:
+        tickers = np.full(found.sum(), 'Unknown', dtype=object)
     
-    for _, trade in trades_df.iterrows():
-        entry_date = trade['EntryTime'].date()
-        
-        # Find cash balance on entry date
-        matching_dates = daily_balance_df[daily_balance_df['Date'].dt.date == entry_date]
-        if len(matching_dates) == 0:
-            print(f"Warning: No cash balance data found for entry date {entry_date}")
-            continue
-        entry_balance = matching_dates['CashBalance'].iloc[0]
-        
-        # Calculate actual position size
+    # Calculate actual position sizes and results for all trades at once
+    with np.errstate(divide='ignore', invalid='ignore'):
         position_cash = entry_balance * 0.10
-        actual_shares = int(position_cash / trade['EntryPrice'])
-        actual_cost = actual_shares * trade['EntryPrice']
-        actual_proceeds = actual_shares * trade['ExitPrice']
-        actual_pnl = actual_proceeds - actual_cost
-        actual_return = (actual_pnl / actual_cost) * 100 if actual_cost > 0 else 0
-        
-        results.append({
-            'EntryDate': trade['EntryTime'],
-            'ExitDate': trade['ExitTime'],
-            'Ticker': trade.get('Ticker', 'Unknown'),
-            'EntryPrice': trade['EntryPrice'],
-            'ExitPrice': trade['ExitPrice'],
-            'CashAvailable': entry_balance,
-            'PositionSize': position_cash,
-            'ActualShares': actual_shares,
-            'ActualCost': actual_cost,
-            'ActualProceeds': actual_proceeds,
-            'ActualPnL': actual_pnl,
-            'ReturnPct': actual_return
-        })
-    
-    return pd.DataFrame(results)
+        actual_shares = np.where(entry_px > 0, np.trunc(position_cash / entry_px), 0).astype(np.int64)
+        shares = actual_shares.astype(float_dtype)
+        if NUMEXPR_AVAILABLE and len(actual_shares) >= NUMEXPR_MIN_TRADES:
+            actual_cost = ne.evaluate("shares * entry_px")
+            actual_proceeds = ne.evaluate("shares * exit_px")
+            actual_pnl = ne.evaluate("actual_proceeds - actual_cost")
+            actual_return = ne.evaluate("where(actual_cost > 0, actual_pnl / actual_cost * 100.0, 0.0)")
+        else:
+            actual_cost = shares * entry_px
+            actual_proceeds = shares * exit_px
+            actual_pnl = actual_proceeds - actual_cost
+            actual_return = np.where(actual_cost > 0, actual_pnl / actual_cost * 100, 0.0)
+    
+    return pd.DataFrame({
+        'EntryDate': entry_times.to_numpy()[found],
+        'ExitDate': exit_times.to_numpy()[found],
+        'Ticker': tickers,
+        'EntryPrice': entry_px,
+        'ExitPrice': exit_px,
+        'CashAvailable': entry_balance.astype(float_dtype, copy=False),
+        'PositionSize': position_cash.astype(float_dtype, copy=False),
+        'ActualShares': actual_shares,
+        'ActualCost': actual_cost,
+        'ActualProceeds': actual_proceeds,
+        'ActualPnL': actual_pnl,
+        'ReturnPct': actual_return.astype(float_dtype, copy=False)
+    }, copy=False)
 
 def detect_column_name(df, possible_names):
     """
@@ -290,6 +538,23 @@ def fuzzy_column_match(columns, target_pattern):
     
     return None
 
+# Date formats smart_date_parser tries, in order
+SMART_DATE_FORMATS = [
+    '%Y-%m-%d',           # 2023-01-01
+    '%m/%d/%Y',           # 01/01/2023
+    '%d/%m/%Y',           # 01/01/2023
+    '%Y-%m-%d %H:%M:%S',  # 2023-01-01 12:00:00
+    '%m/%d/%Y %H:%M:%S',  # 01/01/2023 12:00:00
+    '%d/%m/%Y %H:%M:%S',  # 01/01/2023 12:00:00
+    '%Y%m%d',             # 20230101
+    '%m-%d-%Y',           # 01-01-2023
+    '%d-%m-%Y',           # 01-01-2023
+    '%B %d, %Y',          # January 1, 2023
+    '%b %d, %Y',          # Jan 1, 2023
+    '%d %B %Y',           # 1 January 2023
+    '%d %b %Y'            # 1 Jan 2023
+]
+
 def smart_date_parser(date_value):
     """
     Handle multiple date formats intelligently.
@@ -324,24 +589,7 @@ def smart_date_parser(date_value):
     date_str = re.sub(r'^[^\d]*', '', date_str)  # Remove leading non-digits
     date_str = re.sub(r'[^\d]*$', '', date_str)  # Remove trailing non-digits
     
-    # Common date formats to try
-    date_formats = [
-        '%Y-%m-%d',           # 2023-01-01
-        '%m/%d/%Y',           # 01/01/2023
-        '%d/%m/%Y',           # 01/01/2023
-        '%Y-%m-%d %H:%M:%S',  # 2023-01-01 12:00:00
-        '%m/%d/%Y %H:%M:%S',  # 01/01/2023 12:00:00
-        '%d/%m/%Y %H:%M:%S',  # 01/01/2023 12:00:00
-        '%Y%m%d',             # 20230101
-        '%m-%d-%Y',           # 01-01-2023
-        '%d-%m-%Y',           # 01-01-2023
-        '%B %d, %Y',          # January 1, 2023
-        '%b %d, %Y',          # Jan 1, 2023
-        '%d %B %Y',           # 1 January 2023
-        '%d %b %Y'            # 1 Jan 2023
-    ]
-    
-    for fmt in date_formats:
+    for fmt in SMART_DATE_FORMATS:
         try:
             return datetime.strptime(date_str, fmt)
         except ValueError:
@@ -353,6 +601,48 @@ def smart_date_parser(date_value):
     except:
         return None
 
+def parse_date_column(values):
+    """
+    Parse a whole column of dates the way smart_date_parser parses single values.
+    
+    Text values are trimmed and matched against SMART_DATE_FORMATS one format at a time with
+    vectorized pd.to_datetime, each format only seeing the values earlier ones did not match.
+    Non-text values (Excel serials, datetimes) and text no format matches are handed to
+    smart_date_parser one by one.
+    
+    Parameters:
+    values: Series of raw date values
+    
+    Returns:
+    Series of parsed dates (NaT where parsing fails)
+    """
+    raw = values.to_numpy(dtype=object)
+    is_text = np.fromiter((isinstance(value, str) for value in raw), dtype=bool, count=len(raw))
+    pos = np.flatnonzero(is_text)
+    text = pd.Series(raw[pos], dtype=object).str.strip()
+    text = text.str.replace(r'^[^\d]*', '', regex=True).str.replace(r'[^\d]*$', '', regex=True)
+    
+    try:
+        parsed = np.full(len(raw), np.datetime64('NaT'), dtype='datetime64[us]')
+        for fmt in SMART_DATE_FORMATS:
+            if not len(pos):
+                break
+            matched = pd.to_datetime(text, format=fmt, errors='coerce')
+            hit = matched.notna().to_numpy()
+            parsed[pos[hit]] = matched[hit].to_numpy(dtype='datetime64[us]')
+            text, pos = text[~hit], pos[~hit]
+        
+        leftover = ~is_text
+        leftover[pos] = True
+        if leftover.any():
+            rest = pd.Series(raw[leftover], dtype=object).apply(smart_date_parser)
+            parsed[leftover] = pd.to_datetime(rest).to_numpy(dtype='datetime64[us]')
+    except (ValueError, TypeError):
+        # Mixed time zones and the like cannot share one datetime column; keep per-value results
+        return values.apply(smart_date_parser)
+    
+    return pd.Series(parsed, index=values.index)
+
 def clean_dataframe(df):
     """
     Comprehensive data cleaning pipeline.
@@ -378,6 +668,16 @@ def clean_dataframe(df):
             cleaned_df[col] = cleaned_df[col].str.strip()
             # Replace empty strings with NaN
             cleaned_df[col] = cleaned_df[col].replace('', pd.NA)
+        elif isinstance(cleaned_df[col].dtype, pd.CategoricalDtype):
+            # Same cleaning, applied once per distinct value instead of once per row; values
+            # that clean to the same text are merged and empty ones become missing
+            cleaned = (cleaned_df[col].cat.categories.astype(str)
+                       .str.replace(r'<[^>]+>', '', regex=True).str.strip())
+            new_categories = cleaned[cleaned != ''].unique()
+            remap = new_categories.get_indexer(cleaned)
+            codes = cleaned_df[col].cat.codes.to_numpy()
+            cleaned_df[col] = pd.Categorical.from_codes(np.where(codes >= 0, remap[codes], -1),
+                                                        categories=new_categories)
     
     # Remove completely empty rows
     cleaned_df = cleaned_df.dropna(how='all')
@@ -399,7 +699,7 @@ def clean_dataframe(df):
     date_cols = ['EntryTime', 'ExitTime']
     for col in date_cols:
         if col in cleaned_df.columns:
-            cleaned_df[col] = cleaned_df[col].apply(smart_date_parser)
+            cleaned_df[col] = parse_date_column(cleaned_df[col])
     
     print(f"After cleaning: {len(cleaned_df)} rows and {len(cleaned_df.columns)} columns")
     
@@ -447,6 +747,165 @@ def validate_required_columns(df, data_type='trading'):
         
         return found_count >= 4
 
+# How much of a CSV file is read to detect its delimiter and encoding
+SNIFF_BYTES = 65536
+
+def _sniff(file_path):
+    """
+    Detect a CSV file's delimiter and encoding from its first SNIFF_BYTES bytes.
+    
+    Returns:
+    tuple: (sep, encoding), defaulting to (',', 'utf-8')
+    """
+    with open(file_path, 'rb') as f:
+        head = f.read(SNIFF_BYTES)
+    
+    if head.startswith(codecs.BOM_UTF8):
+        encoding = 'utf-8-sig'
+    elif head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        encoding = 'utf-16'
+    else:
+        try:
+            head.decode('utf-8')
+            encoding = 'utf-8'
+        except UnicodeDecodeError as e:
+            # A multi-byte character cut off at the end of the sample is still UTF-8
+            encoding = 'utf-8' if e.start >= len(head) - 3 and len(head) == SNIFF_BYTES else 'latin-1'
+    
+    # Sniff whole lines only so a row cut off by the sample does not confuse the sniffer
+    text = head.decode(encoding, errors='ignore')
+    if len(head) == SNIFF_BYTES:
+        text = text[:text.rfind('\n') + 1] or text
+    try:
+        sep = csv.Sniffer().sniff(text, delimiters=',;\t|').delimiter
+    except csv.Error:
+        sep = ','
+    return sep, encoding
+
+def read_csv_trade_columns(file_path):
+    """
+    Read a CSV file loading only the trade columns, using the pyarrow engine if installed.
+    
+    The header is read first and run through smart column detection; when all required
+    column types are found only those columns are parsed, otherwise every column is read.
+    The ticker column is read as a category, storing each distinct symbol once. The
+    delimiter and encoding come from _sniff, so nothing is guessed during the full read.
+    
+    Parameters:
+    file_path: Path to the CSV file
+    
+    Returns:
+    DataFrame with the raw (unrenamed) columns
+    """
+    sep, encoding = _sniff(file_path)
+    header = pd.read_csv(file_path, nrows=0, sep=sep, encoding=encoding)
+    smart_mapping = smart_column_detection(header)
+    
+    usecols = [col for col in header.columns if str(col).strip() in smart_mapping]
+    required_types = {'EntryTime', 'ExitTime', 'EntryPrice', 'ExitPrice'}
+    if not required_types.issubset(smart_mapping.values()) or len(usecols) != len(smart_mapping):
+        usecols = None
+    dtype = {col: 'category' for col in header.columns
+             if smart_mapping.get(str(col).strip()) == 'Ticker'}
+    
+    try:
+        return pd.read_csv(file_path, engine='pyarrow', sep=sep, encoding=encoding,
+                           usecols=usecols, dtype=dtype)
+    except ImportError:
+        return pd.read_csv(file_path, engine='c', sep=sep, encoding=encoding,
+                           usecols=usecols, dtype=dtype, memory_map=True)
+
+def _dedup_columns(names):
+    """
+    Make repeated column names unique the way pandas' readers do: 'A', 'A' -> 'A', 'A.1',
+    skipping suffixes that are already taken by another column.
+    """
+    names = list(names)
+    taken = set(names)
+    counts = defaultdict(int)
+    for i, name in enumerate(names):
+        new_name = name
+        count = counts[name]
+        while count > 0:
+            counts[name] = count + 1
+            new_name = f"{name}.{count}"
+            count = count + 1 if new_name in taken else counts[new_name]
+        names[i] = new_name
+        counts[new_name] = count + 1
+    return names
+
+def read_xlsx_read_only(file_path):
+    """
+    Read the first sheet of an .xlsx file with openpyxl in read-only mode.
+    
+    Read-only mode streams the sheet XML row by row instead of building every cell object,
+    and the row tuples go straight into one DataFrame. The result matches
+    pd.read_excel(engine='openpyxl'): the first row is the header, blank header cells become
+    'Unnamed: i', repeated names get '.1', '.2' suffixes and blank rows are kept as NaN.
+    
+    Parameters:
+    file_path: Path to the .xlsx file
+    
+    Returns:
+    DataFrame with the raw (unrenamed) columns, header taken from the first row
+    """
+    from openpyxl import load_workbook
+    
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[0]
+        # Read-only mode trusts the sheet's stored size, which some writers leave at A1:A1
+        sheet.reset_dimensions()
+        # Trim each row's trailing empty cells; rows then only need padding to the widest one
+        rows = []
+        for row in sheet.iter_rows(values_only=True):
+            end = len(row)
+            while end and row[end - 1] is None:
+                end -= 1
+            rows.append(tuple(row[:end]))
+    finally:
+        # Read-only workbooks keep the file open until closed
+        workbook.close()
+    
+    # Drop trailing blank rows, as pandas' own Excel readers do
+    while rows and not rows[-1]:
+        rows.pop()
+    if not rows:
+        return pd.DataFrame()
+    
+    width = max(len(row) for row in rows)
+    header = list(rows[0]) + [None] * (width - len(rows[0]))
+    header = _dedup_columns(f"Unnamed: {i}" if name is None else name for i, name in enumerate(header))
+    pad = (None,) * width
+    df = pd.DataFrame.from_records([row + pad[len(row):] for row in rows[1:]], columns=header)
+    
+    # pandas' readers turn empty cells into NaN, so all-empty columns are float rather than None
+    mixed = df.columns[df.dtypes == object]
+    if len(mixed):
+        df[mixed] = df[mixed].fillna(np.nan).infer_objects()
+    return df
+
+def read_excel_fast(file_path):
+    """
+    Read the first sheet of an Excel file with the Rust-based calamine engine if installed.
+    
+    Without python-calamine, .xlsx/.xlsm files are streamed with openpyxl's read-only mode
+    and other files fall back to pandas' default engine (xlrd/pyxlsb).
+    
+    Parameters:
+    file_path: Path to the .xlsx, .xls or .xlsb file
+    
+    Returns:
+    DataFrame with the raw (unrenamed) columns
+    """
+    try:
+        return pd.read_excel(file_path, engine='calamine')
+    except (ImportError, ValueError):
+        # ValueError: pandas older than 2.2 does not know the calamine engine
+        if os.path.splitext(file_path)[1].lower() in ('.xlsx', '.xlsm'):
+            return read_xlsx_read_only(file_path)
+        return pd.read_excel(file_path)
+
 def robust_data_loading(file_path):
     """
     Try multiple parsing methods with error recovery.
@@ -473,13 +932,15 @@ def robust_data_loading(file_path):
     
     if file_ext == '.csv':
         methods = [
+            ('CSV Fast', lambda: read_csv_trade_columns(file_path)),
             ('CSV Standard', lambda: pd.read_csv(file_path)),
             ('CSV Latin-1', lambda: pd.read_csv(file_path, encoding='latin-1')),
             ('CSV CP1252', lambda: pd.read_csv(file_path, encoding='cp1252')),
             ('CSV UTF-16', lambda: pd.read_csv(file_path, encoding='utf-16'))
         ]
-    elif file_ext in ['.xlsx', '.xls']:
+    elif file_ext in ['.xlsx', '.xls', '.xlsb']:
         methods = [
+            ('Excel Fast', lambda: read_excel_fast(file_path)),
             ('Excel', lambda: pd.read_excel(file_path)),
             ('Excel Engine Openpyxl', lambda: pd.read_excel(file_path, engine='openpyxl')),
             ('Excel Engine Xlrd', lambda: pd.read_excel(file_path, engine='xlrd'))
@@ -583,7 +1044,7 @@ def robust_data_loading(file_path):
     - Entry price information
     - Exit price information
     
-    Supported formats: CSV, Excel (.xlsx, .xls), HTML
+    Supported formats: CSV, Excel (.xlsx, .xls, .xlsb), HTML
     """
     
     raise ValueError(error_msg)
@@ -665,7 +1126,7 @@ def user_friendly_error_handling(error, file_path):
 
 def convert_trade_data_format(df, entry_time_col=None, exit_time_col=None, 
                               entry_price_col='EntryPrice', exit_price_col='ExitPrice',
-                              ticker_col='Ticker'):
+                              ticker_col='Ticker', precision='float64'):
     """
     Convert trade data to the format expected by calculate_dynamic_cash_balance.
     Uses intelligent column detection with fuzzy matching and pattern recognition.
@@ -677,13 +1138,17 @@ def convert_trade_data_format(df, entry_time_col=None, exit_time_col=None,
     entry_price_col: Column name for entry price
     exit_price_col: Column name for exit price
     ticker_col: Column name for ticker (auto-detected if None)
+    precision: 'float64' (default) or 'float32' for the price columns
     
     Returns:
     DataFrame with standardized column names
     """
+    float_dtype = _float_dtype(precision)
     
-    # Create a copy to avoid modifying original data
-    converted_df = df.copy()
+    # Shallow copy: columns are only relabelled here (never written to), and the result is
+    # built as a fresh DataFrame below, so the original data is left untouched without
+    # duplicating it
+    converted_df = df.copy(deep=False)
     
     # Use smart column detection if specific columns not provided
     if any(col is None for col in [entry_time_col, exit_time_col, ticker_col]):
@@ -692,7 +1157,7 @@ def convert_trade_data_format(df, entry_time_col=None, exit_time_col=None,
         print(f"Smart detection found: {smart_mapping}")
         
         # Apply smart mapping
-        converted_df = converted_df.rename(columns=smart_mapping)
+        converted_df.rename(columns=smart_mapping, inplace=True)
         
         # Update column variables
         entry_time_col = smart_mapping.get(entry_time_col, 'EntryTime')
@@ -723,7 +1188,7 @@ def convert_trade_data_format(df, entry_time_col=None, exit_time_col=None,
     if ticker_col and ticker_col in converted_df.columns:
         column_mapping[ticker_col] = 'Ticker'
     
-    converted_df = converted_df.rename(columns=column_mapping)
+    converted_df.rename(columns=column_mapping, inplace=True)
     
     # Ensure required columns exist
     required_cols = ['EntryTime', 'ExitTime', 'EntryPrice', 'ExitPrice']
@@ -732,32 +1197,41 @@ def convert_trade_data_format(df, entry_time_col=None, exit_time_col=None,
     if missing_cols:
         raise ValueError(f"Missing required columns: {missing_cols}")
     
-    # Add Ticker column if not present
-    if 'Ticker' not in converted_df.columns:
-        converted_df['Ticker'] = 'UNKNOWN'
-    
-    # Validate data types and convert dates
+    # Validate data types and convert dates into a fresh DataFrame holding only the needed columns
     try:
-        converted_df['EntryTime'] = pd.to_datetime(converted_df['EntryTime'])
-        converted_df['ExitTime'] = pd.to_datetime(converted_df['ExitTime'])
-        converted_df['EntryPrice'] = pd.to_numeric(converted_df['EntryPrice'])
-        converted_df['ExitPrice'] = pd.to_numeric(converted_df['ExitPrice'])
+        converted_df = pd.DataFrame({
+            'EntryTime': pd.to_datetime(converted_df['EntryTime']),
+            'ExitTime': pd.to_datetime(converted_df['ExitTime']),
+            'EntryPrice': pd.to_numeric(converted_df['EntryPrice']).astype(float_dtype),
+            'ExitPrice': pd.to_numeric(converted_df['ExitPrice']).astype(float_dtype),
+            # Add Ticker column if not present
+            'Ticker': converted_df['Ticker'] if 'Ticker' in converted_df.columns else 'UNKNOWN'
+        })
     except Exception as e:
         raise ValueError(f"Error converting data types: {e}")
     
-    # Validate that exit dates are after entry dates
-    invalid_dates = converted_df['ExitTime'] <= converted_df['EntryTime']
-    if invalid_dates.any():
-        print(f"Warning: {invalid_dates.sum()} trades have exit dates before or equal to entry dates")
-        converted_df = converted_df[~invalid_dates]
-    
-    # Validate prices are positive
-    invalid_prices = (converted_df['EntryPrice'] <= 0) | (converted_df['ExitPrice'] <= 0)
-    if invalid_prices.any():
-        print(f"Warning: {invalid_prices.sum()} trades have non-positive prices")
-        converted_df = converted_df[~invalid_prices]
-    
-    return converted_df[['EntryTime', 'ExitTime', 'EntryPrice', 'ExitPrice', 'Ticker']]
+    # Tickers repeat across many trades, so store each symbol once (a no-op for CSV files,
+    # which already read the column as a category)
+    converted_df['Ticker'] = converted_df['Ticker'].astype('category')
+    
+    # Validate that exit dates are after entry dates and prices are positive, building a
+    # single keep-mask from the raw arrays (NaT/NaN compare False, as with pandas)
+    entry_times = converted_df['EntryTime'].to_numpy()
+    exit_times = converted_df['ExitTime'].to_numpy()
+    entry_prices = converted_df['EntryPrice'].to_numpy()
+    exit_prices = converted_df['ExitPrice'].to_numpy()
+    invalid_dates = exit_times <= entry_times
+    invalid_prices = (entry_prices <= 0) | (exit_prices <= 0)
+    valid = ~(invalid_dates | invalid_prices)
+    
+    if not valid.all():
+        if invalid_dates.any():
+            print(f"Warning: {invalid_dates.sum()} trades have exit dates before or equal to entry dates")
+        bad_price_count = (invalid_prices & ~invalid_dates).sum()
+        if bad_price_count:
+            print(f"Warning: {bad_price_count} trades have non-positive prices")
+    
+    return converted_df[valid]
 
 def validate_cash_balance_inputs(trades_df, starting_cash):
     """
@@ -828,7 +1302,7 @@ def run_complete_cash_tracking_example(starting_cash=1000000):
     
     # Summary statistics
     total_trades = len(updated_trades)
-    winning_trades = len(updated_trades[updated_trades['ActualPnL'] > 0])
+    winning_trades = int((updated_trades['ActualPnL'].to_numpy() > 0).sum())
     win_rate = (winning_trades / total_trades) * 100 if total_trades > 0 else 0
     total_pnl = updated_trades['ActualPnL'].sum()
     final_portfolio_value = daily_balances['TotalPortfolio'].iloc[-1]
@@ -890,7 +1364,7 @@ def run_csv_cash_tracking_example(csv_file_path, starting_cash=1000000):
     
     # Summary statistics
     total_trades = len(updated_trades)
-    winning_trades = len(updated_trades[updated_trades['ActualPnL'] > 0])
+    winning_trades = int((updated_trades['ActualPnL'].to_numpy() > 0).sum())
     win_rate = (winning_trades / total_trades) * 100 if total_trades > 0 else 0
     total_pnl = updated_trades['ActualPnL'].sum()
     final_portfolio_value = daily_balances['TotalPortfolio'].iloc[-1]
@@ -1037,8 +1511,36 @@ def show_output_columns_info():
     print("- TotalPortfolio: Cash + Position Value")
     print("\nThis gives you exact cash balance for every single day!")
 
+def _tracking_dates(start_date, end_date, calendar='D', event_days=None):
+    """
+    Build the dates a day-by-day tracker reports on, from start_date to end_date.
+    
+    Every calendar keeps start_date's time of day, so 'B' and 'events' report a subset of
+    the 'D' dates (apart from a weekend end date, which 'B' rolls forward to a business day).
+    
+    Parameters:
+    start_date, end_date: First and last date to cover
+    calendar: 'D' for every calendar day, 'B' for business days only,
+              'events' for only the days listed in event_days
+    event_days: Day numbers (see _to_day_numbers) of the days with entries or exits;
+                days outside the period (including NaT) are ignored
+    
+    Returns:
+    DatetimeIndex of the dates to report on
+    """
+    if calendar == 'D':
+        return pd.date_range(start=start_date, end=end_date, freq='D')
+    if calendar == 'B':
+        # Roll the end forward so an exit on a weekend still lands on a reported day
+        return pd.bdate_range(start=start_date, end=end_date + pd.offsets.BDay(0), normalize=False)
+    if calendar == 'events':
+        dates = pd.date_range(start=start_date, end=end_date, freq='D')
+        return dates[np.isin(_to_day_numbers(dates), event_days)]
+    raise ValueError(f"Unknown calendar '{calendar}'. Use 'D', 'B' or 'events'.")
+
 # Simplified daily cash tracker function:
-def simple_cash_tracker(entry_dates, exit_dates, entry_prices, exit_prices, starting_cash=1000000):
+def simple_cash_tracker(entry_dates, exit_dates, entry_prices, exit_prices, starting_cash=1000000,
+                        calendar='D'):
     """
     Simplified version for quick implementation
     
@@ -1048,66 +1550,97 @@ def simple_cash_tracker(entry_dates, exit_dates, entry_prices, exit_prices, star
     entry_prices: List of entry prices
     exit_prices: List of exit prices
     starting_cash: Starting cash amount
+    calendar: Days to report on - 'D' every calendar day (default), 'B' business days only,
+              or 'events' only days with entries or exits. Entries/exits on a skipped day are
+              applied on the next reported day; nothing changes on the skipped days themselves.
     """
     
     # Convert to datetime
     entries = pd.to_datetime(entry_dates)
     exits = pd.to_datetime(exit_dates)
+    entry_days = _to_day_numbers(entries)
+    exit_days = _to_day_numbers(exits)
     
     # Create date range
-    start_date = entries.min()
-    end_date = exits.max()
-    dates = pd.date_range(start=start_date, end=end_date, freq='D')
-    
-    # Initialize cash tracking
+    dates = _tracking_dates(entries.min(), exits.max(), calendar,
+                            event_days=np.union1d(entry_days, exit_days))
+    
+    # Only entries and exits inside the tracked period happen, and a trade is never sold
+    # before its entry day; anything else (including NaT dates) is skipped, as a day-by-day
+    # scan of the period would never reach it
+    first_day, last_day = _to_day_numbers([entries.min(), exits.max()])
+    entry_idx = np.flatnonzero((entry_days >= first_day) & (entry_days <= last_day))
+    exit_idx = np.flatnonzero((exit_days >= first_day) & (exit_days <= last_day) &
+                              (exit_days >= entry_days))
+    
+    # Group trade indices by the reported day they fall on once, instead of rescanning
+    # every trade each day
+    date_days = _to_day_numbers(dates)
+    entries_by_day = defaultdict(list)
+    for idx, pos in zip(entry_idx.tolist(), np.searchsorted(date_days, entry_days[entry_idx]).tolist()):
+        entries_by_day[pos].append(idx)
+    exits_by_day = defaultdict(list)
+    for idx, pos in zip(exit_idx.tolist(), np.searchsorted(date_days, exit_days[exit_idx]).tolist()):
+        exits_by_day[pos].append(idx)
+    
+    # Initialize cash tracking; open trades are flagged in arrays indexed by trade
     cash_balance = starting_cash
-    daily_cash = []
-    active_trades = {}  # {trade_id: {shares, exit_date, exit_price}}
-    
-    for current_date in dates:
+    n_trades = len(entry_days)
+    is_open = np.zeros(n_trades, dtype=bool)
+    shares_held = np.zeros(n_trades, dtype=np.int64)
+    n_open = 0
+    
+    # Only reported days with entries or exits change anything; simulate just those and fill
+    # the days in between afterwards. Each list starts with the state before the first event.
+    n_days = len(dates)
+    event_pos = np.array(sorted(pos for pos in entries_by_day.keys() | exits_by_day.keys()
+                                if pos < n_days), dtype=np.int64)
+    cash_col, flow_col, active_col = [starting_cash], [0], [0]
+    
+    for pos in event_pos.tolist():
         daily_cash_flow = 0
         
         # Check for new entries
-        for i, entry_date in enumerate(entries):
-            if entry_date.date() == current_date.date():
-                # Invest 10% of available cash
-                investment_amount = cash_balance * 0.10
-                shares = int(investment_amount / entry_prices[i])
-                actual_cost = shares * entry_prices[i]
-                
-                cash_balance -= actual_cost
-                daily_cash_flow -= actual_cost
-                
-                # Track this trade
-                active_trades[i] = {
-                    'shares': shares,
-                    'exit_date': exits[i],
-                    'exit_price': exit_prices[i],
-                    'entry_price': entry_prices[i]
-                }
+        for i in entries_by_day.get(pos, ()):
+            # Invest 10% of available cash
+            investment_amount = cash_balance * 0.10
+            shares = int(investment_amount / entry_prices[i])
+            actual_cost = shares * entry_prices[i]
+            
+            cash_balance -= actual_cost
+            daily_cash_flow -= actual_cost
+            
+            # Track this trade
+            is_open[i] = True
+            shares_held[i] = shares
+            n_open += 1
         
-        # Check for exits
-        trades_to_remove = []
-        for trade_id, trade_info in active_trades.items():
-            if trade_info['exit_date'].date() == current_date.date():
+        # Check for exits (only trades that are currently open can be sold)
+        for trade_id in exits_by_day.get(pos, ()):
+            if is_open[trade_id]:
                 # Sell shares
-                proceeds = trade_info['shares'] * trade_info['exit_price']
+                proceeds = shares_held[trade_id] * exit_prices[trade_id]
                 cash_balance += proceeds
                 daily_cash_flow += proceeds
-                trades_to_remove.append(trade_id)
-        
-        # Remove completed trades
-        for trade_id in trades_to_remove:
-            del active_trades[trade_id]
+                is_open[trade_id] = False
+                n_open -= 1
         
-        daily_cash.append({
-            'Date': current_date,
-            'CashBalance': cash_balance,
-            'DailyCashFlow': daily_cash_flow,
-            'ActiveTrades': len(active_trades)
-        })
-    
-    return pd.DataFrame(daily_cash)
+        cash_col.append(cash_balance)
+        flow_col.append(daily_cash_flow)
+        active_col.append(n_open)
+    
+    # Each day takes the state of the latest event day at or before it (0 = no event yet);
+    # the cash flow only happens on the event day itself
+    last_event = np.searchsorted(event_pos, np.arange(n_days), side='right')
+    on_event = np.zeros(n_days, dtype=np.int64)
+    on_event[event_pos] = np.arange(1, len(event_pos) + 1)
+    
+    return pd.DataFrame({
+        'Date': dates,
+        'CashBalance': np.asarray(cash_col)[last_event],
+        'DailyCashFlow': np.asarray(flow_col)[on_event],
+        'ActiveTrades': np.asarray(active_col, dtype=np.int64)[last_event]
+    }, copy=False)
 
 # Example usage with your data structure:
 def process_trading_data(csv_file_path=None, trades_data=None, starting_cash=1000000):
@@ -1135,7 +1668,7 @@ def process_trading_data(csv_file_path=None, trades_data=None, starting_cash=100
     
     # Summary statistics
     total_trades = len(updated_trades)
-    winning_trades = len(updated_trades[updated_trades['ActualPnL'] > 0])
+    winning_trades = int((updated_trades['ActualPnL'].to_numpy() > 0).sum())
     win_rate = (winning_trades / total_trades) * 100 if total_trades > 0 else 0
     total_pnl = updated_trades['ActualPnL'].sum()
     final_portfolio_value = daily_balances['TotalPortfolio'].iloc[-1]
@@ -1419,10 +1952,13 @@ def compare_strategy_vs_benchmark(strategy_daily_balances, benchmark_daily_balan
     # Calculate returns
     merged['Strategy_Return'] = merged['TotalPortfolio_strategy'].pct_change()
     merged['Benchmark_Return'] = merged['TotalPortfolio_benchmark'].pct_change()
+    # First-day returns are NaN; fill them once and reuse below
+    strategy_returns = merged['Strategy_Return'].fillna(0)
+    benchmark_returns = merged['Benchmark_Return'].fillna(0)
     
     # Calculate cumulative returns
-    merged['Strategy_CumReturn'] = (1 + merged['Strategy_Return'].fillna(0)).cumprod() - 1
-    merged['Benchmark_CumReturn'] = (1 + merged['Benchmark_Return'].fillna(0)).cumprod() - 1
+    merged['Strategy_CumReturn'] = (1 + strategy_returns).cumprod() - 1
+    merged['Benchmark_CumReturn'] = (1 + benchmark_returns).cumprod() - 1
     
     # Calculate performance metrics
     strategy_total_return = merged['Strategy_CumReturn'].iloc[-1]
@@ -1438,8 +1974,8 @@ def compare_strategy_vs_benchmark(strategy_daily_balances, benchmark_daily_balan
     benchmark_sharpe = (benchmark_total_return * 252) / (benchmark_vol * np.sqrt(252)) if benchmark_vol > 0 else 0
     
     # Calculate beta
-    covariance = np.cov(merged['Strategy_Return'].fillna(0), merged['Benchmark_Return'].fillna(0))[0, 1]
-    benchmark_variance = np.var(merged['Benchmark_Return'].fillna(0))
+    covariance = np.cov(strategy_returns, benchmark_returns)[0, 1]
+    benchmark_variance = np.var(benchmark_returns)
     beta = covariance / benchmark_variance if benchmark_variance > 0 else 0
     
     # Calculate maximum drawdown
@@ -1477,7 +2013,8 @@ def compare_strategy_vs_benchmark(strategy_daily_balances, benchmark_daily_balan
     
     return results
 
-def run_benchmark_analysis(trades_file_path, benchmark_file_path, starting_cash=1000000):
+def run_benchmark_analysis(trades_file_path, benchmark_file_path, starting_cash=1000000, trades_df=None,
+                           daily_balances=None, updated_trades=None):
     """
     Run complete analysis comparing strategy vs benchmark
     
@@ -1485,6 +2022,10 @@ def run_benchmark_analysis(trades_file_path, benchmark_file_path, starting_cash=
     trades_file_path: Path to trading data CSV/Excel file
     benchmark_file_path: Path to benchmark data CSV file
     starting_cash: Starting cash amount
+    trades_df: Trades already loaded from trades_file_path (optional, skips reloading the file)
+    daily_balances, updated_trades: Results of calculate_dynamic_cash_balance and
+        recalculate_trade_metrics for these trades and starting_cash (optional, both
+        needed to skip recalculating them)
     
     Returns:
     Tuple: (strategy_results, benchmark_results, comparison_metrics)
@@ -1495,26 +2036,32 @@ def run_benchmark_analysis(trades_file_path, benchmark_file_path, starting_cash=
     # Load and analyze trading strategy
     print("\n📊 Analyzing Trading Strategy...")
     
-    # Use robust loading system for trading data
-    print(f"Loading trading data: {trades_file_path}")
-    trades_df = robust_data_loading(trades_file_path)
-    
-    # Convert to standard format
-    trades_df = convert_trade_data_format(trades_df)
-    
-    if trades_df.empty:
-        print("❌ Failed to load trading data")
-        return None, None, None
-    
-    # Calculate daily cash balances
-    daily_balances, final_positions = calculate_dynamic_cash_balance(trades_df, starting_cash)
+    if daily_balances is not None and updated_trades is not None:
+        print(f"Using already calculated results for: {trades_file_path}")
+    elif trades_df is None:
+        # Use robust loading system for trading data
+        print(f"Loading trading data: {trades_file_path}")
+        trades_df = robust_data_loading(trades_file_path)
+        
+        # Convert to standard format
+        trades_df = convert_trade_data_format(trades_df)
+    else:
+        print(f"Using already loaded trading data: {trades_file_path}")
     
-    # Recalculate trade metrics
-    updated_trades = recalculate_trade_metrics(trades_df, daily_balances)
+    if daily_balances is None or updated_trades is None:
+        if trades_df.empty:
+            print("❌ Failed to load trading data")
+            return None, None, None
+        
+        # Calculate daily cash balances
+        daily_balances, final_positions = calculate_dynamic_cash_balance(trades_df, starting_cash)
+        
+        # Recalculate trade metrics
+        updated_trades = recalculate_trade_metrics(trades_df, daily_balances)
     
     # Summary statistics
     total_trades = len(updated_trades)
-    winning_trades = len(updated_trades[updated_trades['ActualPnL'] > 0])
+    winning_trades = int((updated_trades['ActualPnL'].to_numpy() > 0).sum())
     win_rate = (winning_trades / total_trades) * 100 if total_trades > 0 else 0
     total_pnl = updated_trades['ActualPnL'].sum()
     final_portfolio_value = daily_balances['TotalPortfolio'].iloc[-1]
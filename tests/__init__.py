@@ -0,0 +1,11 @@
+"""
+Tests for the cash balance tracker (stdlib unittest).
+
+Run from the repository root with: python -m unittest discover -s tests
+"""
+
+import os
+import sys
+
+# Make the top-level modules importable however the tests are started
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,100 @@
+"""
+Shared helpers for the tests: the original cash balance day loop, a trades factory and
+TestCase bases.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import pandas as pd
+
+
+def reference_cash_balance(trades_df, starting_cash=1000000, size_from_starting_cash=False):
+    """
+    The original calculate_dynamic_cash_balance day loop; with size_from_starting_cash each
+    position is sized from starting_cash instead of the available cash
+    """
+    trades_df = trades_df.copy()
+    trades_df['EntryTime'] = pd.to_datetime(trades_df['EntryTime'])
+    trades_df['ExitTime'] = pd.to_datetime(trades_df['ExitTime'])
+    trades_df = trades_df.sort_values('EntryTime').reset_index(drop=True)
+    
+    date_range = pd.date_range(start=trades_df['EntryTime'].min(), end=trades_df['ExitTime'].max(), freq='D')
+    rows = []
+    active_positions = []
+    cash_balance = starting_cash
+    
+    for current_date in date_range:
+        # Exits first, then entries
+        still_open = []
+        for position in active_positions:
+            if position['exit_date'].date() == current_date.date():
+                cash_balance += position['shares'] * position['exit_price']
+            else:
+                still_open.append(position)
+        active_positions = still_open
+        
+        for _, trade in trades_df[trades_df['EntryTime'].dt.date == current_date.date()].iterrows():
+            sizing_cash = starting_cash if size_from_starting_cash else cash_balance
+            shares = int(sizing_cash * 0.10 / trade['EntryPrice']) if trade['EntryPrice'] > 0 else 0
+            if shares > 0:
+                cost = shares * trade['EntryPrice']
+                cash_balance -= cost
+                active_positions.append({
+                    'exit_date': trade['ExitTime'],
+                    'entry_price': trade['EntryPrice'],
+                    'exit_price': trade['ExitPrice'],
+                    'shares': shares,
+                })
+        
+        position_value = sum(pos['shares'] * pos['entry_price'] for pos in active_positions)
+        rows.append({
+            'Date': current_date,
+            'CashBalance': cash_balance,
+            'ActivePositions': len(active_positions),
+            'PositionValue': position_value,
+            'TotalPortfolio': cash_balance + position_value
+        })
+    
+    return pd.DataFrame(rows), active_positions
+
+
+def make_trades(entries, exits, entry_prices, exit_prices):
+    return pd.DataFrame({
+        'EntryTime': pd.to_datetime(pd.Series(entries)),
+        'ExitTime': pd.to_datetime(pd.Series(exits)),
+        'EntryPrice': entry_prices,
+        'ExitPrice': exit_prices,
+    })
+
+
+class CashBalanceReferenceTest(unittest.TestCase):
+    """Compares a cash balance function (set as calculate) with reference_cash_balance"""
+    
+    calculate = None
+    size_from_starting_cash = False
+    
+    def assert_matches_reference(self, trades_df, starting_cash=1000000):
+        expected, expected_open = reference_cash_balance(trades_df, starting_cash, self.size_from_starting_cash)
+        result, result_open = self.calculate(trades_df, starting_cash)
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+        self.assertEqual(sorted((p['shares'], p['exit_price']) for p in result_open),
+                         sorted((p['shares'], p['exit_price']) for p in expected_open))
+
+
+class TempDirTestCase(unittest.TestCase):
+    """Gives each test a scratch directory, removed afterwards"""
+    
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+    
+    def write(self, data, name='trades.csv'):
+        path = os.path.join(self.tmp, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
@@ -0,0 +1,53 @@
+"""
+Equivalence checks for calculate_dynamic_cash_balance against the original day-by-day loop.
+
+Run with: python -m unittest discover -s tests
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from cash_balance_tracker import calculate_dynamic_cash_balance
+from tests.helpers import CashBalanceReferenceTest, make_trades
+
+
+class DynamicCashBalanceTest(CashBalanceReferenceTest):
+    
+    calculate = staticmethod(calculate_dynamic_cash_balance)
+    
+    def test_random_trades(self):
+        rng = np.random.default_rng(0)
+        n = 150
+        entries = pd.Timestamp('2021-01-01') + pd.to_timedelta(rng.integers(0, 90, n), 'D')
+        exits = entries + pd.to_timedelta(rng.integers(0, 15, n), 'D')
+        self.assert_matches_reference(make_trades(entries, exits, rng.uniform(5, 200, n), rng.uniform(5, 200, n)))
+    
+    def test_same_day_exit_never_closes(self):
+        self.assert_matches_reference(make_trades(['2021-01-04', '2021-01-05'], ['2021-01-04', '2021-01-07'],
+                                                  [10.0, 20.0], [11.0, 19.0]))
+    
+    def test_exits_outside_the_range(self):
+        # One exit falls before the first entry, one entry after the last exit
+        self.assert_matches_reference(make_trades(['2021-01-04', '2021-01-08', '2021-01-20'],
+                                                  ['2021-01-10', '2021-01-01', '2021-01-09'],
+                                                  [10.0, 20.0, 30.0], [11.0, 19.0, 31.0]))
+    
+    def test_nat_dates_are_skipped(self):
+        self.assert_matches_reference(make_trades(['2021-01-04', None, '2021-01-05'],
+                                                  ['2021-01-08', '2021-01-09', None],
+                                                  [10.0, 20.0, 30.0], [11.0, 19.0, 31.0]))
+    
+    def test_intraday_times_use_the_calendar_day(self):
+        self.assert_matches_reference(make_trades(['2021-01-04 15:30', '2021-01-05 09:00'],
+                                                  ['2021-01-06 10:00', '2021-01-07 10:00'],
+                                                  [10.0, 20.0], [11.0, 19.0]))
+    
+    def test_empty_input_raises(self):
+        with self.assertRaises(ValueError):
+            calculate_dynamic_cash_balance(make_trades([], [], [], []))
+
+
+if __name__ == '__main__':
+    unittest.main()
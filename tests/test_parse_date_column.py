@@ -0,0 +1,66 @@
+"""
+Equivalence checks for parse_date_column against per-value smart_date_parser.
+
+Run with: python -m unittest discover -s tests
+"""
+
+import unittest
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from cash_balance_tracker import parse_date_column, smart_date_parser
+
+
+class ParseDateColumnTest(unittest.TestCase):
+    
+    def assert_matches_per_value(self, values):
+        values = pd.Series(values, dtype=object)
+        expected = pd.to_datetime(values.apply(smart_date_parser))
+        result = pd.to_datetime(parse_date_column(values))
+        self.assertEqual(len(result), len(values))
+        self.assertTrue(result.index.equals(values.index))
+        pd.testing.assert_series_equal(result.astype('datetime64[us]'), expected.astype('datetime64[us]'),
+                                       check_names=False)
+    
+    def test_each_format(self):
+        self.assert_matches_per_value([
+            '2023-01-05', '01/05/2023', '25/01/2023', '2023-01-05 12:30:00',
+            '01/05/2023 08:00:00', '25/01/2023 17:45:10', '20230105', '01-05-2023',
+            '25-01-2023', '5 January 2023', '5 Jan 2023',
+        ])
+    
+    def test_first_matching_format_wins(self):
+        # Ambiguous day/month order is read month first, as smart_date_parser does
+        self.assert_matches_per_value(['03/04/2023', '04/03/2023', '12/11/2023'])
+    
+    def test_whitespace_prefixes_and_suffixes(self):
+        self.assert_matches_per_value(['  2023-01-05 ', 'Date: 2023-01-06', '2023-01-07 (close)', '\t20230108\n'])
+    
+    def test_unparseable_and_missing_values(self):
+        self.assert_matches_per_value(['not a date', '', '2023-13-45', None, np.nan, pd.NaT, '2023-01-05'])
+    
+    def test_values_left_to_pandas(self):
+        self.assert_matches_per_value(['2023-01-05T10:15:00', '2023/01/06', 'January 7, 2023', '2023-01-05'])
+    
+    def test_non_text_values(self):
+        self.assert_matches_per_value([44927, 44927.5, datetime(2023, 1, 5, 9, 30),
+                                       pd.Timestamp('2023-01-06'), '2023-01-07'])
+    
+    def test_mixed_time_zones_fall_back(self):
+        values = pd.Series(['2023-01-05T10:00:00+05:00', '2023-01-06T10:00:00-03:00', '2023-01-07'], dtype=object)
+        result = parse_date_column(values)
+        expected = values.apply(smart_date_parser)
+        self.assertEqual(list(result), list(expected))
+    
+    def test_empty_column(self):
+        result = parse_date_column(pd.Series([], dtype=object))
+        self.assertEqual(len(result), 0)
+    
+    def test_keeps_the_index(self):
+        self.assert_matches_per_value(pd.Series(['2023-01-05', 'x', '01/06/2023'], index=[10, 3, 7]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Equivalence checks for read_xlsx_read_only against pd.read_excel with the openpyxl engine.
+
+Run with: python -m unittest discover -s tests
+"""
+
+import importlib.util
+import os
+import re
+import unittest
+import zipfile
+
+import pandas as pd
+
+from cash_balance_tracker import read_xlsx_read_only
+from tests.helpers import TempDirTestCase
+
+OPENPYXL_AVAILABLE = importlib.util.find_spec("openpyxl") is not None
+
+
+@unittest.skipUnless(OPENPYXL_AVAILABLE, "openpyxl is not installed")
+class ReadXlsxReadOnlyTest(TempDirTestCase):
+    
+    def write_rows(self, rows, name='trades.xlsx'):
+        from openpyxl import Workbook
+        workbook = Workbook()
+        for row in rows:
+            workbook.active.append(row)
+        path = os.path.join(self.tmp, name)
+        workbook.save(path)
+        return path
+    
+    def with_stale_dimension(self, path):
+        """Rewrite the sheet's stored size to A1:A1, as some writers leave it"""
+        stale = path.replace('.xlsx', '_stale.xlsx')
+        with zipfile.ZipFile(path) as src, zipfile.ZipFile(stale, 'w') as dst:
+            for item in src.infolist():
+                data = src.read(item.filename)
+                if item.filename.startswith('xl/worksheets/'):
+                    data = re.sub(rb'<dimension ref="[^"]*"/>', b'<dimension ref="A1:A1"/>', data)
+                dst.writestr(item, data)
+        return stale
+    
+    def assert_matches_read_excel(self, path):
+        pd.testing.assert_frame_equal(read_xlsx_read_only(path), pd.read_excel(path, engine='openpyxl'))
+    
+    def test_trade_sheet(self):
+        trades = pd.DataFrame({
+            'Symbol': ['AAPL', 'MSFT', 'NVDA'],
+            'Entry Time': pd.to_datetime(['2023-01-03 09:30', '2023-01-04 10:00', '2023-01-05 15:45']),
+            'Exit Time': pd.to_datetime(['2023-01-05', '2023-01-09', None]),
+            'Entry Price': [125.07, 230.0, 14.5],
+            'Exit Price': [126, 227.12, None],
+        })
+        path = os.path.join(self.tmp, 'trades.xlsx')
+        trades.to_excel(path, index=False)
+        self.assert_matches_read_excel(path)
+        self.assert_matches_read_excel(self.with_stale_dimension(path))
+    
+    def test_stale_dimension_does_not_cut_the_sheet(self):
+        path = self.with_stale_dimension(self.write_rows([['EntryTime', 'ExitTime', 'EntryPrice'],
+                                                          ['2023-01-03', '2023-01-05', 10.5],
+                                                          ['2023-01-04', '2023-01-06', 11.5]]))
+        self.assertEqual(read_xlsx_read_only(path).shape, (2, 3))
+        self.assert_matches_read_excel(path)
+    
+    def test_repeated_and_blank_headers(self):
+        self.assert_matches_read_excel(self.write_rows([['A', 'B', 'A', None, 'A.1', 'A'],
+                                                        [1, 'x', 2.5, None, 3, 4],
+                                                        [5, None, 6, 7]]))
+    
+    def test_blank_rows_and_ragged_rows(self):
+        path = self.write_rows([[], ['A', 'B'], [1, 2], [], [3, None, None, 9], [], []])
+        self.assert_matches_read_excel(path)
+        self.assert_matches_read_excel(self.with_stale_dimension(path))
+    
+    def test_header_only_and_empty_sheets(self):
+        self.assert_matches_read_excel(self.write_rows([['EntryTime', 'ExitTime']]))
+        self.assertTrue(read_xlsx_read_only(self.write_rows([])).empty)
+
+
+if __name__ == '__main__':
+    unittest.main()
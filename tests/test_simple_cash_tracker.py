@@ -0,0 +1,132 @@
+"""
+Equivalence checks for simple_cash_tracker against the original day-by-day loop.
+
+Run with: python -m unittest discover -s tests
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from cash_balance_tracker import simple_cash_tracker
+
+
+def reference_simple_cash_tracker(entry_dates, exit_dates, entry_prices, exit_prices, starting_cash=1000000):
+    """The original implementation: scan every trade on every calendar day"""
+    entries = pd.to_datetime(entry_dates)
+    exits = pd.to_datetime(exit_dates)
+    dates = pd.date_range(start=entries.min(), end=exits.max(), freq='D')
+    
+    cash_balance = starting_cash
+    daily_cash = []
+    active_trades = {}
+    
+    for current_date in dates:
+        daily_cash_flow = 0
+        for i, entry_date in enumerate(entries):
+            if entry_date.date() == current_date.date():
+                investment_amount = cash_balance * 0.10
+                shares = int(investment_amount / entry_prices[i])
+                actual_cost = shares * entry_prices[i]
+                cash_balance -= actual_cost
+                daily_cash_flow -= actual_cost
+                active_trades[i] = {'shares': shares, 'exit_date': exits[i], 'exit_price': exit_prices[i]}
+        
+        trades_to_remove = []
+        for trade_id, trade_info in active_trades.items():
+            if trade_info['exit_date'].date() == current_date.date():
+                proceeds = trade_info['shares'] * trade_info['exit_price']
+                cash_balance += proceeds
+                daily_cash_flow += proceeds
+                trades_to_remove.append(trade_id)
+        for trade_id in trades_to_remove:
+            del active_trades[trade_id]
+        
+        daily_cash.append({
+            'Date': current_date,
+            'CashBalance': cash_balance,
+            'DailyCashFlow': daily_cash_flow,
+            'ActiveTrades': len(active_trades)
+        })
+    
+    return pd.DataFrame(daily_cash)
+
+
+class SimpleCashTrackerTest(unittest.TestCase):
+    
+    def assert_matches_reference(self, entry_dates, exit_dates, entry_prices, exit_prices):
+        expected = reference_simple_cash_tracker(entry_dates, exit_dates, entry_prices, exit_prices)
+        result = simple_cash_tracker(entry_dates, exit_dates, entry_prices, exit_prices)
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+    
+    def test_random_trades(self):
+        rng = np.random.default_rng(0)
+        n = 200
+        entries = pd.Timestamp('2021-01-01') + pd.to_timedelta(rng.integers(0, 120, n), 'D')
+        exits = entries + pd.to_timedelta(rng.integers(0, 20, n), 'D')
+        self.assert_matches_reference(list(entries), list(exits),
+                                      rng.uniform(5, 200, n).tolist(), rng.uniform(5, 200, n).tolist())
+    
+    def test_same_day_entry_and_exit(self):
+        self.assert_matches_reference(['2021-01-04', '2021-01-04'], ['2021-01-04', '2021-01-06'],
+                                      [10.0, 20.0], [11.0, 19.0])
+    
+    def test_exit_before_first_tracked_day_is_never_applied(self):
+        # The first trade opens on the first day but "exits" before it: it is never sold
+        self.assert_matches_reference(['2021-01-04', '2021-01-05'], ['2021-01-01', '2021-01-08'],
+                                      [10.0, 20.0], [11.0, 19.0])
+    
+    def test_exit_before_entry_is_never_applied(self):
+        self.assert_matches_reference(['2021-01-04', '2021-01-10'], ['2021-01-12', '2021-01-06'],
+                                      [10.0, 20.0], [11.0, 19.0])
+    
+    def test_entry_after_last_exit_is_never_applied(self):
+        self.assert_matches_reference(['2021-01-04', '2021-01-20'], ['2021-01-08', '2021-01-25'],
+                                      [10.0, 20.0], [11.0, 19.0])
+        self.assert_matches_reference(['2021-01-04', '2021-01-20'], ['2021-01-08', '2021-01-06'],
+                                      [10.0, 20.0], [11.0, 19.0])
+    
+    def test_nat_dates_are_skipped(self):
+        self.assert_matches_reference(['2021-01-04', None, '2021-01-05'], ['2021-01-08', '2021-01-09', None],
+                                      [10.0, 20.0, 30.0], [11.0, 19.0, 31.0])
+    
+    def test_intraday_times_use_the_calendar_day(self):
+        self.assert_matches_reference(['2021-01-04 15:30', '2021-01-05 09:00'], ['2021-01-06 10:00', '2021-01-07 16:00'],
+                                      [10.0, 20.0], [11.0, 19.0])
+    
+    def test_empty_input_raises_like_the_reference(self):
+        with self.assertRaises(ValueError):
+            reference_simple_cash_tracker([], [], [], [])
+        with self.assertRaises(ValueError):
+            simple_cash_tracker([], [], [], [])
+    
+    def test_other_calendars_end_with_the_same_cash(self):
+        rng = np.random.default_rng(1)
+        n = 50
+        entries = pd.Timestamp('2021-01-01 09:30') + pd.to_timedelta(rng.integers(0, 60, n), 'D')
+        exits = entries + pd.to_timedelta(rng.integers(1, 10, n), 'D')
+        prices = (rng.uniform(5, 200, n).tolist(), rng.uniform(5, 200, n).tolist())
+        # NaT dates, an exit before the first entry and an entry after the last exit
+        messy = (['2021-01-04', None, '2021-01-08', '2021-01-20'], ['2021-01-10', '2021-01-09', '2021-01-01', '2021-01-09'],
+                 [10.0, 20.0, 30.0, 40.0], [11.0, 19.0, 31.0, 41.0])
+        for args in [(list(entries), list(exits)) + prices, messy]:
+            daily = simple_cash_tracker(*args)
+            for calendar in ['events', 'B']:
+                with self.subTest(calendar=calendar, rows=len(args[0])):
+                    other = simple_cash_tracker(*args, calendar=calendar)
+                    # 'B' applies weekend entries on Monday, which can change the compounded sizes
+                    if calendar == 'events':
+                        self.assertEqual(other['CashBalance'].iloc[-1], daily['CashBalance'].iloc[-1])
+                    self.assertEqual(other['ActiveTrades'].iloc[-1], daily['ActiveTrades'].iloc[-1])
+                    self.assertFalse(other['Date'].isna().any())
+                    self.assertGreaterEqual(other['Date'].iloc[0], daily['Date'].iloc[0])
+                    # 'B' may roll a weekend end date forward; otherwise every date is a 'D' date
+                    dates = other['Date'] if calendar == 'events' else other['Date'].iloc[:-1]
+                    self.assertTrue(dates.isin(daily['Date']).all())
+        
+        events = simple_cash_tracker(*messy, calendar='events')
+        self.assertEqual(events['Date'].dt.strftime('%m-%d').tolist(), ['01-04', '01-08', '01-09', '01-10'])
+
+if __name__ == '__main__':
+    unittest.main()
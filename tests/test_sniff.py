@@ -0,0 +1,88 @@
+"""
+Checks for _sniff delimiter/encoding detection and the CSV fast path that uses it.
+
+Run with: python -m unittest discover -s tests
+"""
+
+import unittest
+
+import pandas as pd
+
+from cash_balance_tracker import SNIFF_BYTES, _sniff, read_csv_trade_columns
+from tests.helpers import TempDirTestCase
+
+HEADER = ['Symbol', 'Entry Time', 'Exit Time', 'Entry Price', 'Exit Price']
+ROWS = [
+    ['AAPL', '2023-01-03 09:30:00', '2023-01-05 16:00:00', '125.07', '126.36'],
+    ['MSFT', '2023-01-04 09:30:00', '2023-01-09 16:00:00', '229.77', '227.12'],
+    ['Nestlé', '2023-01-05 10:00:00', '2023-01-06 15:30:00', '110.5', '111.25'],
+]
+
+
+class SniffTest(TempDirTestCase):
+    
+    def write_rows(self, sep=',', encoding='utf-8', rows=ROWS):
+        text = '\n'.join(sep.join(row) for row in [HEADER] + rows) + '\n'
+        return self.write(text.encode(encoding))
+    
+    def assert_frames_match(self, result, expected):
+        # The fast path reads tickers as a category and pyarrow may parse the timestamps;
+        # compare the values themselves
+        def normalize(df):
+            df = df.astype({'Symbol': object})
+            for col in ['Entry Time', 'Exit Time']:
+                df[col] = pd.to_datetime(df[col]).astype('datetime64[ns]')
+            return df
+        pd.testing.assert_frame_equal(normalize(result), normalize(expected))
+    
+    def test_comma_utf8_matches_the_old_default_read(self):
+        path = self.write_rows()
+        self.assertEqual(_sniff(path), (',', 'utf-8'))
+        self.assert_frames_match(read_csv_trade_columns(path), pd.read_csv(path))
+    
+    def test_other_delimiters(self):
+        for sep in [';', '\t', '|']:
+            with self.subTest(sep=repr(sep)):
+                path = self.write_rows(sep=sep)
+                self.assertEqual(_sniff(path), (sep, 'utf-8'))
+                self.assert_frames_match(read_csv_trade_columns(path), pd.read_csv(path, sep=sep))
+    
+    def test_quoted_fields_keep_the_comma(self):
+        rows = [['"Acme; Inc"', '2023-01-03', '2023-01-05', '1.5', '2.5'],
+                ['"Foo; Bar"', '2023-01-04', '2023-01-06', '3.5', '4.5']]
+        self.assertEqual(_sniff(self.write_rows(rows=rows))[0], ',')
+    
+    def test_encodings(self):
+        cases = [('latin-1', 'latin-1'), ('utf-8-sig', 'utf-8-sig'), ('utf-16', 'utf-16')]
+        for written, detected in cases:
+            with self.subTest(encoding=written):
+                path = self.write_rows(sep=';', encoding=written)
+                self.assertEqual(_sniff(path), (';', detected))
+                self.assertEqual(read_csv_trade_columns(path)['Symbol'].tolist()[-1], 'Nestlé')
+    
+    def test_multibyte_character_cut_by_the_sample_is_still_utf8(self):
+        line = ','.join(['Nestle', '2023-01-05', '2023-01-06', '1.5', '2.5']) + '\n'
+        body = (','.join(HEADER) + '\n').encode('utf-8')
+        while len(body) < SNIFF_BYTES - 200:
+            body += line.encode('utf-8')
+        # Pad one ticker so its two-byte 'é' straddles the end of the sample
+        padding = 'A' * (SNIFF_BYTES - 1 - len(body))
+        body += line.replace('Nestle', padding + 'éNestle').encode('utf-8')
+        path = self.write(body)
+        with open(path, 'rb') as f:
+            head = f.read(SNIFF_BYTES)
+        self.assertRaises(UnicodeDecodeError, head.decode, 'utf-8')
+        self.assertEqual(_sniff(path), (',', 'utf-8'))
+    
+    def test_single_column_defaults_to_comma(self):
+        path = self.write(b'Entry Time\n2023-01-03\n2023-01-04\n')
+        self.assertEqual(_sniff(path), (',', 'utf-8'))
+    
+    def test_empty_file(self):
+        path = self.write(b'')
+        self.assertEqual(_sniff(path), (',', 'utf-8'))
+        self.assertRaises(pd.errors.EmptyDataError, read_csv_trade_columns, path)
+
+
+if __name__ == '__main__':
+    unittest.main()
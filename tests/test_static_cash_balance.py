@@ -0,0 +1,66 @@
+"""
+Equivalence checks for calculate_static_cash_balance against a day-by-day reference loop.
+
+Run with: python -m unittest discover -s tests
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from cash_balance_tracker import calculate_static_cash_balance
+from tests.helpers import CashBalanceReferenceTest, make_trades
+
+
+class StaticCashBalanceTest(CashBalanceReferenceTest):
+    
+    calculate = staticmethod(calculate_static_cash_balance)
+    size_from_starting_cash = True
+    
+    def test_random_trades(self):
+        rng = np.random.default_rng(0)
+        n = 150
+        entries = pd.Timestamp('2021-01-01') + pd.to_timedelta(rng.integers(0, 90, n), 'D')
+        exits = entries + pd.to_timedelta(rng.integers(0, 15, n), 'D')
+        self.assert_matches_reference(make_trades(entries, exits, rng.uniform(5, 200, n), rng.uniform(5, 200, n)))
+    
+    def test_same_day_exit_never_closes(self):
+        self.assert_matches_reference(make_trades(['2021-01-04', '2021-01-05'], ['2021-01-04', '2021-01-07'],
+                                                  [10.0, 20.0], [11.0, 19.0]))
+    
+    def test_exit_before_entry_never_closes(self):
+        self.assert_matches_reference(make_trades(['2021-01-04', '2021-01-08'], ['2021-01-10', '2021-01-05'],
+                                                  [10.0, 20.0], [11.0, 19.0]))
+    
+    def test_entry_after_last_exit_is_never_taken(self):
+        self.assert_matches_reference(make_trades(['2021-01-04', '2021-01-20'], ['2021-01-10', '2021-01-09'],
+                                                  [10.0, 20.0], [11.0, 19.0]))
+    
+    def test_unaffordable_and_unpriced_trades_are_skipped(self):
+        self.assert_matches_reference(make_trades(['2021-01-04', '2021-01-05', '2021-01-05'],
+                                                  ['2021-01-06', '2021-01-07', '2021-01-08'],
+                                                  [10.0, 5e6, 0.0], [11.0, 6e6, 1.0]))
+    
+    def test_nat_dates_are_skipped(self):
+        self.assert_matches_reference(make_trades(['2021-01-04', None, '2021-01-05'],
+                                                  ['2021-01-08', '2021-01-09', None],
+                                                  [10.0, 20.0, 30.0], [11.0, 19.0, 31.0]))
+    
+    def test_intraday_times_use_the_calendar_day(self):
+        self.assert_matches_reference(make_trades(['2021-01-04 15:30', '2021-01-05 09:00'],
+                                                  ['2021-01-06 10:00', '2021-01-07 16:00'],
+                                                  [10.0, 20.0], [11.0, 19.0]))
+        # The range steps from the first entry's time of day, so an exit earlier in the day
+        # than that on the last date falls past the end of the range and never happens
+        self.assert_matches_reference(make_trades(['2021-01-04 15:30', '2021-01-05 09:00'],
+                                                  ['2021-01-06 10:00', '2021-01-07 10:00'],
+                                                  [10.0, 20.0], [11.0, 19.0]))
+    
+    def test_empty_input_raises(self):
+        with self.assertRaises(ValueError):
+            calculate_static_cash_balance(make_trades([], [], [], []))
+
+
+if __name__ == '__main__':
+    unittest.main()